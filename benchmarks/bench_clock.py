@@ -0,0 +1,588 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import shutil
+import string
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+from types import SimpleNamespace
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from desktop_clock import export  # noqa: E402
+from desktop_clock.drag import WindowDragger  # noqa: E402
+from desktop_clock.fontsearch import FontIndex  # noqa: E402
+from desktop_clock.info import DRAIN_MS, SOURCES, FakeSource, InfoSampler  # noqa: E402
+from desktop_clock.layout import window_size  # noqa: E402
+from desktop_clock.render import LabelRenderer  # noqa: E402
+from desktop_clock.resize import MAX_SIZE, MIN_SIZE, LiveResize  # noqa: E402
+from desktop_clock.scheduler import TickScheduler, next_midnight  # noqa: E402
+from desktop_clock.settings import SettingsStore  # noqa: E402
+from desktop_clock.simulate import HeadlessClock, simulate  # noqa: E402
+from desktop_clock.stats import rss_kb  # noqa: E402
+from desktop_clock.timesource import SimulatedClock  # noqa: E402
+from desktop_clock.visibility import ManualDetector, VisibilityMonitor  # noqa: E402
+
+FONT_LIST_SIZES = (1000, 10000, 50000)
+REFRESH_SIZES = (24, 110, 400)
+# The original clock re-armed a 5 s after() to poll the time
+LEGACY_POLL_MS = 5000
+
+
+# -------------------- Helpers --------------------
+
+def per_call_us(fn, number=1000, repeat=5):
+    return min(timeit.Timer(fn).repeat(repeat=repeat, number=number)) / number * 1e6
+
+
+def synthetic_fonts(count, seed=1):
+    rng = random.Random(seed)
+    words = ["".join(rng.choice(string.ascii_letters) for _ in range(rng.randint(3, 9)))
+             for _ in range(400)]
+    return sorted(" ".join(rng.sample(words, rng.randint(1, 3))) for _ in range(count))
+
+
+class VirtualWidget:
+    # Enough of the Tk widget API to drive the model layer headlessly, with
+    # a virtual millisecond clock for after() timers.
+
+    def __init__(self):
+        self.now_ms = 0
+        self.timers = {}
+        self.calls = 0
+        self._next_id = 0
+
+    def config(self, **options):
+        self.calls += 1
+
+    def geometry(self, spec=None):
+        self.calls += 1
+
+    def lower(self):
+        self.calls += 1
+
+    def winfo_x(self):
+        return 0
+
+    def winfo_y(self):
+        return 0
+
+    def after(self, ms, callback):
+        self._next_id += 1
+        after_id = f"after#{self._next_id}"
+        self.timers[after_id] = (self.now_ms + ms, callback)
+        return after_id
+
+    def after_cancel(self, after_id):
+        self.timers.pop(after_id, None)
+
+    def advance(self, ms):
+        self.now_ms += ms
+        for after_id, (due, callback) in sorted(self.timers.items(), key=lambda t: t[1][0]):
+            if due <= self.now_ms and after_id in self.timers:
+                del self.timers[after_id]
+                callback()
+
+
+class FixedMetrics:
+    def extent(self, family, size, weight, text):
+        return len(text) * size * 6 // 10, size * 4 // 3
+
+
+# -------------------- Model layer --------------------
+
+def bench_tick():
+    widget = VirtualWidget()
+    label = VirtualWidget()
+    renderer = LabelRenderer(widget)
+    text = {"value": "12:00"}
+
+    def tick():
+        renderer.config(label, text=text["value"])
+        renderer.lower()
+
+    def legacy_tick():
+        label.config(text=time.strftime("%H:%M"))
+        label.config(text="Saturday, October 17, 2026")
+        widget.lower()
+
+    scheduler = TickScheduler(widget)
+    scheduler.add_job(tick)
+    scheduler.add_job(lambda: None, next_midnight)
+    scheduler.start()
+
+    def scheduled_tick():
+        text["value"] = "12:01" if text["value"] == "12:00" else "12:00"
+        for job in scheduler.jobs:
+            job.target = 0
+        scheduler.cancel()
+        scheduler._on_timer()
+
+    # Wakeups over a simulated hour: the boundary scheduler vs the 5 s poll
+    hour = SimulatedClock(start=1792195230.0)  # mid-minute, so the hour holds 60 boundaries
+    hourly = TickScheduler(None, hour)
+    hourly.add_job(lambda: None)
+    hourly.add_job(lambda: None, next_midnight)
+    hourly.start()
+    legacy = {"wakeups": 0}
+
+    def poll():
+        legacy["wakeups"] += 1
+        hour.after(LEGACY_POLL_MS, poll)
+
+    hour.after(LEGACY_POLL_MS, poll)
+    hour.advance(3600)
+
+    return {
+        "render_unchanged_us": per_call_us(tick, number=20000),
+        "scheduled_tick_us": per_call_us(scheduled_tick, number=5000),
+        "legacy_tick_us": per_call_us(legacy_tick, number=5000),
+        "renderer": renderer.stats(),
+        "wakeups_per_minute": hourly.wakeups / 60,
+        "legacy_wakeups_per_minute": legacy["wakeups"] / 60,
+    }
+
+
+def date_format_targets():
+    face = SimpleNamespace(lang="Turkish", caption="", now=time.localtime,
+                           _date_key=None, _date_text="")
+    from desktop_clock.app import ClockFace
+    yield "app", ClockFace.get_formatted_date, face, "_date_key"
+
+
+def bench_date_format():
+    results = {}
+    for name, method, owner, key_attr in date_format_targets():
+        def uncached():
+            setattr(owner, key_attr, None)
+            method(owner)
+
+        results[name] = {
+            "cached_us": per_call_us(lambda: method(owner), number=20000),
+            "uncached_us": per_call_us(uncached, number=20000),
+        }
+    return results
+
+
+def bench_refresh_layout():
+    metrics = FixedMetrics()
+    return {
+        str(size): per_call_us(
+            lambda: window_size(metrics, "Didot", size, "12:00",
+                                "17 Ekim 2026, Cumartesi", "1/3", True, (4, 4)),
+            number=20000
+        )
+        for size in REFRESH_SIZES
+    }
+
+
+def bench_font_search():
+    results = {}
+    for count in FONT_LIST_SIZES:
+        fonts = synthetic_fonts(count)
+        build_start = time.perf_counter()
+        index = FontIndex(fonts)
+        build_ms = (time.perf_counter() - build_start) * 1000
+
+        def typing(query="ab c"):
+            for end in range(1, len(query) + 1):
+                index.search(query[:end])
+            index.search("")
+
+        def legacy_typing(query="ab c"):
+            # What update_list/_filter_fonts did per keystroke before the index.
+            for end in range(1, len(query) + 1):
+                [name for name in fonts if query[:end] in name.lower()]
+            [name for name in fonts if "" in name.lower()]
+
+        per_keystroke = []
+        for end in range(1, 5):
+            start = time.perf_counter()
+            index.search("ab c"[:end])
+            per_keystroke.append((time.perf_counter() - start) * 1000)
+        index.search("")
+
+        results[str(count)] = {
+            "index_build_ms": build_ms,
+            "max_keystroke_ms": max(per_keystroke),
+            "typing_sequence_ms": per_call_us(typing, number=5, repeat=3) / 1000,
+            "legacy_typing_sequence_ms": per_call_us(legacy_typing, number=5, repeat=3) / 1000,
+        }
+    return results
+
+
+def bench_drag(rate_hz=1000, seconds=1.0):
+    root = VirtualWidget()
+    dragger = WindowDragger(root)
+    event = SimpleNamespace(x_root=0, y_root=0)
+    dragger.start(event)
+    step_ms = 1000 // rate_hz
+    start = time.perf_counter()
+    for i in range(int(rate_hz * seconds)):
+        event.x_root, event.y_root = i, i // 2
+        dragger.motion(event)
+        root.advance(step_ms)
+    dragger.release(event)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    return dict(dragger.stats(), handler_ms_total=elapsed_ms)
+
+
+def bench_live_resize(step_ms=2):
+    # Sweep the size slider from one end to the other, one event per step_ms
+    widget = VirtualWidget()
+    metrics = FixedMetrics()
+    commits = []
+
+    def preview(size):
+        window_size(metrics, "Didot", size, "12:00", "17 Ekim 2026, Cumartesi", "1/3", True, (4, 4))
+
+    live = LiveResize(widget, MIN_SIZE, preview, commits.append)
+    start = time.perf_counter()
+    for size in range(MIN_SIZE, MAX_SIZE + 1):
+        live.request(size)
+        widget.advance(step_ms)
+    widget.advance(1000)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    return dict(live.stats(), commits=len(commits), handler_ms_total=elapsed_ms)
+
+
+def bench_info_lines(samples=300):
+    # Tk-thread cost of the sampler (submit + drain) with a fake source whose
+    # value repeats twice out of three, plus what each real source costs a worker
+    widget = VirtualWidget()
+    changes = []
+    sampler = InfoSampler(TickScheduler(widget), changes.append)
+    source = FakeSource("fake", ["1.00", "1.00", "2.00"])
+    sampler.add(source)
+    tk_thread = 0.0
+    for _ in range(samples):
+        start = time.perf_counter()
+        sampler._submit(source)
+        tk_thread += time.perf_counter() - start
+        while sampler.results.empty():
+            time.sleep(0)
+        start = time.perf_counter()
+        widget.advance(DRAIN_MS)
+        tk_thread += time.perf_counter() - start
+    sampler.shutdown()
+    return {
+        "tk_thread_us_per_sample": tk_thread / samples * 1e6,
+        "label_updates": len(changes),
+        "samples": samples,
+        "source_sample_us": {name: per_call_us(source_class().sample, number=200)
+                             for name, source_class in SOURCES.items()},
+    }
+
+
+def bench_simulation(days=7):
+    # A week of minute ticks and midnights on a simulated clock
+    time_source = SimulatedClock(start=1774652400.0)  # 2026-03-28, spans a DST change in Europe
+    report = simulate(HeadlessClock(time_source), time_source, days)
+    return {
+        "cpu_ms_per_day": report["cpu_s"] * 1000 / days,
+        "wakeups_per_day": report["wakeups"] / days,
+        "mismatches": report["mismatches"],
+        "growth_bytes_per_day": report["growth_bytes_per_day"],
+    }
+
+
+def bench_export(minutes=120):
+    # Two replayed hours of PNG frames: every minute is a fresh render, then
+    # the same minutes again without the date come straight from the cache
+    if not export.pillow_available():
+        return {"skipped": "Pillow is not installed"}
+    style = dict(export.DEFAULT_STYLE, font="DejaVu Sans")
+    renderer = export.FrameRenderer(style)
+    for show_date in (True, False, False):
+        style["show_date"] = show_date
+        exporter = export.FrameExporter(style, renderer, SimpleNamespace(write=lambda data, when: None),
+                                         SimulatedClock(start=1792195200.0))  # 2026-10-17 00:00 UTC
+        exporter.run(minutes)
+    stats = renderer.stats()
+    return {
+        "render_ms": stats["render"]["avg_ms"],
+        "render_max_ms": stats["render"]["max_ms"],
+        "cache_hit_us": stats["cache_hit"]["avg_ms"] * 1000,
+        "hits": stats["hits"],
+        "misses": stats["misses"],
+    }
+
+
+def bench_suspension(minutes=60):
+    widget = VirtualWidget()
+    scheduler = TickScheduler(widget)
+    scheduler.add_job(lambda: None)
+    monitor = VisibilityMonitor(lambda visible: scheduler.resume() if visible else scheduler.suspend())
+    session = ManualDetector()
+    session.start(monitor)
+    scheduler.start()
+
+    session.set_active(False)
+    before = scheduler.wakeups
+    for _ in range(minutes):
+        widget.advance(60000)
+    hidden_wakeups = scheduler.wakeups - before
+    session.set_active(True)
+    return {
+        "hidden_wakeups_per_hour": hidden_wakeups * 60 // minutes,
+        "timers_armed_after_resume": len(widget.timers),
+    }
+
+
+def bench_memory_per_clock(clocks=20):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    kept = []
+    for _ in range(clocks):
+        widget = VirtualWidget()
+        scheduler = TickScheduler(widget)
+        renderer = LabelRenderer(widget)
+        scheduler.add_job(lambda: renderer.config(widget, text="12:00"))
+        scheduler.add_job(lambda: None, next_midnight)
+        scheduler.start()
+        kept.append((widget, scheduler, renderer, WindowDragger(widget)))
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    grown = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return {"model_bytes_per_clock": grown // clocks}
+
+
+# -------------------- Tk layer --------------------
+
+def start_virtual_display():
+    if os.environ.get("DISPLAY") or platform.system() in ("Windows", "Darwin"):
+        return None
+    xvfb = shutil.which("Xvfb")
+    if not xvfb:
+        return None
+    display = f":{random.randint(90, 199)}"
+    process = subprocess.Popen([xvfb, display, "-screen", "0", "1920x1080x24", "-nolisten", "tcp"],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    os.environ["DISPLAY"] = display
+    time.sleep(0.5)
+    return process
+
+
+def bench_tk(renderer="label", fonts=1000):
+    from unittest import mock
+
+    from desktop_clock import app as module
+    # A throwaway store: neither the developer's saved clocks nor their settings file take part
+    settings_dir = tempfile.TemporaryDirectory()
+    store = SettingsStore(os.path.join(settings_dir.name, "settings.json"))
+    rss_before = rss_kb()
+    app = module.DesktopClock(renderer=renderer, run=False, settings=store)
+    rss_after = rss_kb()
+    app.root.update()
+    face = app.faces[0]
+
+    def sweep():
+        for size in range(MIN_SIZE, MAX_SIZE + 1, 8):
+            face.preview_size(size)
+        # Released: the commit's one full layout is not a slider frame
+        face.renderer.previewing = False
+
+    refresh = {}
+    for size in REFRESH_SIZES:
+        def run(size=size):
+            face.current_size = size
+            face.refresh_ui()
+            face.current_size = size + 1
+            face.refresh_ui()
+        refresh[str(size)] = per_call_us(run, number=20, repeat=3) / 2
+
+    picker = module.FontPicker(app.root, face.current_font, lambda name: None, app.font_cache)
+    picker.list_view.index = FontIndex(synthetic_fonts(fonts))
+
+    def search():
+        for query in ("a", "ab", "ab ", ""):
+            picker.list_view._query = query
+            picker.list_view.flush()
+
+    event = SimpleNamespace(x=5, y=5, x_root=100, y_root=100)
+    face.start_move(event)
+
+    def drag():
+        event.x_root += 1
+        face.do_move(event)
+
+    # The same settings changes, one control message each vs one batch
+    batches = ({"size": 90, "date_align": "left", "date_ratio": "1/4", "lang": "English"},
+               {"size": 110, "date_align": "center", "date_ratio": "1/3", "lang": "Turkish"})
+
+    def one_by_one():
+        for batch in batches:
+            for key, value in batch.items():
+                face.apply(**{key: value})
+
+    def batched():
+        for batch in batches:
+            face.apply(**batch)
+
+    with mock.patch.object(app, "save_settings"):
+        settings = {
+            "one_by_one_us": per_call_us(one_by_one, number=10, repeat=3) / len(batches),
+            "batched_us": per_call_us(batched, number=10, repeat=3) / len(batches),
+        }
+
+    results = {
+        "tick_us": per_call_us(app.update_clock, number=200),
+        "settings_batch": settings,
+        "live_resize_frame_us": per_call_us(sweep, number=2, repeat=3) / len(range(MIN_SIZE, MAX_SIZE + 1, 8)),
+        "refresh_us": refresh,
+        f"search_{fonts}_ms": per_call_us(search, number=5, repeat=3) / 4000,
+        "drag_event_us": per_call_us(drag, number=500),
+        "rss_kb_per_clock": rss_after - rss_before,
+    }
+    face.end_move(event)
+
+    # Menu clicks: the first open builds the dialog, later ones reuse it
+    dialogs = {}
+    for dialog_class, args in ((module.FontPicker, (face.current_font, face.set_font, app.font_cache)),
+                               (module.DateSettingsWindow, (face,)),
+                               (module.SizeSlider, (face,))):
+        def cycle(dialog_class=dialog_class, args=args):
+            app.dialogs.open(dialog_class, *args)
+            app.root.update_idletasks()
+            app.dialogs.close(dialog_class)
+
+        rss_before_dialog = rss_kb()
+        first_open_ms = per_call_us(cycle, number=1, repeat=1) / 1000
+        reopen_ms = per_call_us(cycle, number=20, repeat=3) / 1000
+        dialogs[dialog_class.__name__] = {
+            "first_open_ms": first_open_ms,
+            "reopen_ms": reopen_ms,
+            "rss_kb_after_61_opens": rss_kb() - rss_before_dialog,
+        }
+        app.dialogs.teardown(dialog_class)
+    results["dialogs"] = dialogs
+
+    zones = ("Europe/London", "America/New_York", "Asia/Tokyo", "Australia/Sydney")
+    rss_before_zones = rss_kb()
+    for zone in zones:
+        app.add_zone(zone)
+    app.root.update()
+    results["rss_kb_per_extra_face"] = (rss_kb() - rss_before_zones) / len(zones)
+    results["scheduler_jobs"] = len(app.scheduler.jobs)
+    app.root.destroy()
+    settings_dir.cleanup()
+    return results
+
+
+# -------------------- Backends --------------------
+
+# Run in a fresh interpreter per backend, so imports and RSS are its own.
+BACKEND_PROBE = '''
+import json, sys, time
+started = time.perf_counter()
+import desktop_clock.app
+core_ms = (time.perf_counter() - started) * 1000
+started = time.perf_counter()
+from desktop_clock.backends import load_backend
+load_backend(sys.argv[1])
+backend_ms = (time.perf_counter() - started) * 1000
+from desktop_clock.stats import rss_kb
+print(json.dumps({
+    "core_import_ms": core_ms,
+    "backend_import_ms": backend_ms,
+    "rss_kb": rss_kb(),
+    "modules": len(sys.modules),
+    "appkit_loaded": "AppKit" in sys.modules,
+}))
+'''
+
+
+def bench_backends():
+    from desktop_clock.backends import BACKENDS
+    results = {}
+    for name in BACKENDS:
+        completed = subprocess.run([sys.executable, "-c", BACKEND_PROBE, name], cwd=ROOT,
+                                   capture_output=True, text=True)
+        if completed.returncode:
+            results[name] = {"skipped": completed.stderr.strip().splitlines()[-1:]}
+        else:
+            results[name] = json.loads(completed.stdout)
+    return results
+
+
+# -------------------- Reporting --------------------
+
+def flatten(data, prefix=""):
+    for key, value in data.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            yield from flatten(value, f"{name}.")
+        elif isinstance(value, (int, float)):
+            yield name, value
+
+
+def compare(results, baseline):
+    base = dict(flatten(baseline))
+    for name, value in flatten(results):
+        if name in base and base[name]:
+            print(f"{name:55s} {base[name]:12.3f} -> {value:12.3f}  ({value / base[name]:.2f}x)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Desktop Clock hot-path benchmarks")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--baseline", help="compare against a previous JSON result")
+    parser.add_argument("--no-tk", action="store_true", help="skip the Tk benchmarks")
+    args = parser.parse_args(argv)
+
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.time(),
+        },
+        "tick": bench_tick(),
+        "date_format": bench_date_format(),
+        "refresh_layout_us": bench_refresh_layout(),
+        "font_search": bench_font_search(),
+        "drag": bench_drag(),
+        "live_resize": bench_live_resize(),
+        "info_lines": bench_info_lines(),
+        "simulation": bench_simulation(),
+        "backends": bench_backends(),
+        "export": bench_export(),
+        "suspension": bench_suspension(),
+        "memory": bench_memory_per_clock(),
+    }
+
+    if not args.no_tk:
+        xvfb = start_virtual_display()
+        results["tk"] = {}
+        try:
+            for renderer in ("label", "canvas", "glyphs"):
+                try:
+                    results["tk"][renderer] = bench_tk(renderer)
+                except Exception as error:  # no display, no Tk, ...
+                    results["tk"][renderer] = {"skipped": str(error)}
+        finally:
+            if xvfb:
+                xvfb.terminate()
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as handle:
+            handle.write(text)
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline) as handle:
+            compare(results, json.load(handle))
+
+
+if __name__ == "__main__":
+    main()
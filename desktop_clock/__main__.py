@@ -0,0 +1,3 @@
+from desktop_clock.app import main
+
+main()
@@ -0,0 +1,490 @@
+import os
+import tkinter as tk
+import sys
+import time
+
+from desktop_clock.backends import BACKENDS, load_backend
+from desktop_clock.control import ControlServer, parse_assignments
+from desktop_clock.dialogs import DialogPool
+from desktop_clock.drag import WindowDragger
+from desktop_clock.fontcache import FontFamilyCache
+from desktop_clock.fontsearch import FontListView
+from desktop_clock.info import SOURCES, InfoSampler
+from desktop_clock.layout import TextMetrics, anchor_for
+from desktop_clock.localization import date_formatter, locale_names
+from desktop_clock.render import DISPLAYS, create_display
+from desktop_clock.resize import MAX_SIZE, MIN_SIZE, LiveResize, anchored_x
+from desktop_clock.scheduler import TickScheduler, next_midnight, next_midnight_in
+from desktop_clock.settings import DEFAULT_STYLE, SETTING_CHECKS, SettingsStore, checked_style
+from desktop_clock.startup import DISPLAY_WAIT, FirstPaint, create_root
+from desktop_clock.stats import ClockStats
+from desktop_clock.timesource import SYSTEM_CLOCK
+from desktop_clock.visibility import VisibilityMonitor, WindowDetector, session_detectors, suspension_enabled
+
+# --- SETTINGS A FACE ACCEPTS (menu, control socket, --set); checked by settings.SETTING_CHECKS ---
+STYLE_ATTRS = {'font': 'current_font', 'size': 'current_size', 'show_date': 'show_date',
+               'date_align': 'date_align', 'date_ratio': 'date_ratio_str', 'lang': 'lang', 'info': 'info'}
+
+class FontPicker(tk.Toplevel):
+    def __init__(self, parent, current_font, callback, font_cache):
+        super().__init__(parent)
+        self.title("Select Font")
+        self.geometry("300x450")
+        self.callback = callback
+        
+        self.search_var = tk.StringVar()
+        self.search_var.trace("w", self.update_list)
+        tk.Label(self, text="Search Fonts:").pack(pady=5)
+        self.entry = tk.Entry(self, textvariable=self.search_var)
+        self.entry.pack(fill='x', padx=10)
+        self.entry.focus_set()
+
+        self.frame = tk.Frame(self)
+        self.frame.pack(fill='both', expand=True, padx=10, pady=10)
+        self.listbox = tk.Listbox(self.frame)
+        self.listbox.pack(side='left', fill='both', expand=True)
+        
+        scrollbar = tk.Scrollbar(self.frame, command=self.listbox.yview)
+        scrollbar.pack(side='right', fill='y')
+        self.listbox.config(yscrollcommand=scrollbar.set)
+        
+        self.list_view = FontListView(self.listbox, font_cache.index(self))
+        self.listbox.bind("<<ListboxSelect>>", self.on_select)
+        self.list_view.flush()
+        self.list_view.select(current_font)
+
+    def resync(self, current_font, callback, font_cache):
+        # Reopened from the pool: the list is still filled, only retarget it
+        self.callback = callback
+        index = font_cache.index(self)
+        if index is not self.list_view.index:
+            self.list_view.index, self.list_view.shown = index, None
+            self.list_view.flush()
+        self.list_view.select(current_font)
+        self.entry.focus_set()
+
+    def update_list(self, *args):
+        self.list_view.request(self.search_var.get())
+
+    def on_select(self, event):
+        if self.listbox.curselection():
+            selected = self.listbox.get(self.listbox.curselection())
+            self.callback(selected)
+
+class DateSettingsWindow(tk.Toplevel):
+    def __init__(self, parent, clock_app):
+        super().__init__(parent)
+        self.title("Date Settings")
+        self.clock = clock_app
+        self.geometry("280x350")
+        self.resizable(False, False)
+
+        self.show_var = tk.BooleanVar()
+        tk.Checkbutton(self, text="Show Date", variable=self.show_var, 
+                       command=self.sync_show).pack(pady=10)
+
+        from tkinter import ttk
+        tk.Label(self, text="Alignment:").pack()
+        self.align_combo = ttk.Combobox(self, values=["center", "left", "right"], state="readonly")
+        self.align_combo.pack(pady=5)
+        self.align_combo.bind("<<ComboboxSelected>>", lambda e: self.set_val('date_align', self.align_combo))
+
+        tk.Label(self, text="Font Ratio:").pack()
+        self.ratio_combo = ttk.Combobox(self, values=["1/4", "1/3", "1/2"], state="readonly")
+        self.ratio_combo.pack(pady=5)
+        self.ratio_combo.bind("<<ComboboxSelected>>", lambda e: self.set_val('date_ratio', self.ratio_combo))
+
+        tk.Label(self, text="Language:").pack()
+        self.lang_combo = ttk.Combobox(self, values=locale_names(), state="readonly")
+        self.lang_combo.pack(pady=5)
+        self.lang_combo.bind("<<ComboboxSelected>>", lambda e: self.set_val('lang', self.lang_combo))
+        self.resync(clock_app)
+
+    def resync(self, clock_app):
+        self.clock = clock_app
+        self.show_var.set(clock_app.show_date)
+        self.align_combo.set(clock_app.date_align)
+        self.ratio_combo.set(clock_app.date_ratio_str)
+        self.lang_combo.set(clock_app.lang)
+
+    def sync_show(self):
+        self.clock.apply(show_date=self.show_var.get())
+
+    def set_val(self, key, combo):
+        self.clock.apply(**{key: combo.get()})
+
+class SizeSlider(tk.Toplevel):
+    def __init__(self, parent, face):
+        super().__init__(parent)
+        self.title("Time Size")
+        self.resizable(False, False)
+        self.live = None
+        self.scale = tk.Scale(self, orient='horizontal', length=320,
+                              command=lambda value: self.live.request(int(float(value))))
+        self.scale.pack(padx=10, pady=10)
+        self.scale.bind("<ButtonRelease-1>", lambda e: self.live.finish())
+        self.resync(face)
+
+    def resync(self, face):
+        # Reopened for another face while still showing: settle the old one's pending frame and save first
+        if self.live is not None: self.live.finish()
+        self.live = LiveResize(self, face.current_size, face.preview_size, face.commit_size)
+        # Range widened to the current size so opening never clamps it
+        self.scale.config(from_=min(MIN_SIZE, face.current_size), to=max(MAX_SIZE, face.current_size))
+        self.scale.set(face.current_size)
+
+    def release(self):
+        self.live.finish()
+
+class ClockFace:
+    # One time/date label pair in its own window. The first face lives in the
+    # Tk root; extra time zones get Toplevels sharing the interpreter,
+    # fonts, metrics cache and tick scheduler of their DesktopClock.
+
+    def __init__(self, clock, window, style, zone=None):
+        self.clock = clock
+        self.root = window
+        self.zone = zone
+        self.tz = None
+        if zone:
+            from zoneinfo import ZoneInfo
+            self.tz = ZoneInfo(zone)
+        self.caption = zone.rsplit('/', 1)[-1].replace('_', ' ') if zone else ''
+
+        self.current_font, self.current_size = style['font'], style['size']
+        self.show_date, self.date_align = style['show_date'], style['date_align']
+        self.date_ratio_str, self.lang = style['date_ratio'], style['lang']
+        self.info = [name for name in style['info'] if name in SOURCES]
+        self._date_key = None
+        self._date_text = ""
+
+        self.renderer = create_display(clock.renderer_kind, window, clock.configure_window(window))
+        self.first_paint = FirstPaint(self.renderer.widgets[0])
+        self.dragger = WindowDragger(window, on_commit=self.save_settings)
+        window.bind("<Map>", self.renderer.mark_raised, add="+")
+
+        for w in self.renderer.widgets:
+            w.bind("<Button-1>", self.start_move)
+            w.bind("<B1-Motion>", self.do_move)
+            w.bind("<ButtonRelease-1>", self.end_move)
+            w.bind("<Button-2>", self.show_menu)
+            w.bind("<Button-3>", self.show_menu)
+
+        self.scheduler = clock.scheduler
+        midnight = next_midnight_in(self.tz) if self.tz else next_midnight
+        self.date_job = self.scheduler.add_job(self.update_date, midnight)
+
+    def now(self):
+        if self.tz is None: return self.clock.time_source.localtime()
+        return self.clock.time_source.now_in(self.tz)
+
+    def get_formatted_date(self):
+        t = self.now()
+        key = (t.tm_year, t.tm_yday, self.lang)
+        if key == self._date_key: return self._date_text
+        text = date_formatter(self.lang)(t)
+        if self.caption: text = f"{self.caption} - {text}"
+        self._date_key, self._date_text = key, text
+        return text
+
+    def style(self):
+        return {'font': self.current_font, 'size': self.current_size, 'show_date': self.show_date,
+                'date_align': self.date_align, 'date_ratio': self.date_ratio_str, 'lang': self.lang,
+                'info': list(self.info)}
+
+    def set_font(self, font_name):
+        self.apply(font=font_name)
+
+    def apply(self, **changes):
+        # Validate the whole batch first, then pay for one layout pass and one save
+        for key, value in changes.items():
+            if key not in SETTING_CHECKS: raise ValueError(f"unknown setting {key!r}")
+            if not SETTING_CHECKS[key](value): raise ValueError(f"invalid {key}: {value!r}")
+        style = {key: value for key, value in changes.items()
+                 if key in STYLE_ATTRS and getattr(self, STYLE_ATTRS[key]) != value}
+        for key, value in style.items(): setattr(self, STYLE_ATTRS[key], value)
+        if 'info' in style: self.clock.sync_info()
+        if style: self.refresh_ui()
+        moved = 'x' in changes or 'y' in changes
+        if moved: self.dragger.place(changes.get('x', self.dragger.x), changes.get('y', self.dragger.y))
+        if style or moved: self.save_settings()
+
+    def save_settings(self, *_):
+        self.clock.save_settings()
+
+    def refresh_ui(self):
+        time_text, date_text = time.strftime('%H:%M', self.now()), self.get_formatted_date()
+        self.ww, self.wh = self.renderer.layout(self.clock.metrics, self.current_font, self.current_size,
+                                                self.date_ratio_str, time_text, date_text,
+                                                anchor_for(self.date_align), self.show_date,
+                                                self.clock.info.text(self.info))
+
+    def center_window(self, top=100):
+        sw = self.root.winfo_screenwidth()
+        self.dragger.place((sw-self.ww)//2, top)
+
+    def start_move(self, event):
+        self.root.lift(); self.renderer.mark_raised()
+        self.dragger.start(event)
+
+    def do_move(self, event):
+        self.dragger.motion(event)
+
+    def end_move(self, event):
+        # Back behind other windows as soon as the drag ends, not at the next tick
+        self.dragger.release(event)
+        self.renderer.lower()
+
+    def show_menu(self, event):
+        self.clock.show_menu(event, self)
+
+    def prompt_position(self):
+        from tkinter import simpledialog
+        text = simpledialog.askstring("Window Position", "Enter X,Y:", parent=self.root)
+        if not text: return
+        try: x, y = (int(part) for part in text.split(','))
+        except ValueError: return
+        self.apply(x=x, y=y)
+
+    def edit_size(self):
+        self.clock.dialogs.open(SizeSlider, self)
+
+    def preview_size(self, size):
+        # Live slider frame: one layout pass, with the aligned edge pinned in place
+        self.renderer.previewing = True
+        self.current_size = size
+        self.relayout()
+
+    def commit_size(self, size):
+        # Slider settled: the full layout (glyph atlas included) and one save
+        self.renderer.previewing = False
+        self.current_size = size
+        self.relayout()
+        self.save_settings()
+
+    def relayout(self):
+        # New window size with the aligned edge (or the centre) kept where it was
+        old_width = self.ww
+        self.refresh_ui()
+        self.dragger.place(anchored_x(self.dragger.x, old_width, self.ww, self.date_align), self.dragger.y)
+
+    def update_clock(self):
+        self.renderer.set_time_text(time.strftime('%H:%M', self.now()))
+        self.renderer.lower()
+
+    def update_date(self):
+        # Once a day: the new date can be wider ("Pazar" -> "Pazartesi"), so it gets a full layout
+        if self.show_date: self.relayout()
+
+    def destroy(self):
+        self.scheduler.remove_job(self.date_job)
+        self.root.destroy()
+
+class DesktopClock:
+    def __init__(self, zones=(), renderer=None, changes=None, control=None, time_source=SYSTEM_CLOCK, run=True,
+                 backend=None, settings=None):
+        # Transparency, window behaviour and dock/taskbar hiding for this OS only
+        self.backend = load_backend(backend)
+        # A simulation has no login to wait for: a missing display fails at once
+        self.root = create_root(0.0 if time_source.simulated else DISPLAY_WAIT)
+        self.time_source = time_source
+        self.renderer_kind = renderer or os.environ.get("DESKTOP_CLOCK_RENDERER", "label")
+        
+        # Defaults
+        defaults = dict(DEFAULT_STYLE, font=self.backend.default_font)
+
+        # Saved settings override the defaults before anything is laid out (benchmarks pass their own store)
+        self.settings = settings or SettingsStore(persist=not time_source.simulated)
+        saved = self.settings.load(dict(defaults, x=None, y=None, faces=[]))
+        
+        # Shared by every face: one tick scheduler, one metrics cache, one menu
+        self.font_cache = FontFamilyCache()
+        self.metrics = TextMetrics(self.root)
+        self.scheduler = TickScheduler(self.root, time_source)
+        self.scheduler.add_job(self.update_clock)
+        self.menu = None
+        self.menu_face = None
+        self.dialogs = DialogPool(self.root)
+        self.info = InfoSampler(self.scheduler, self.on_info)
+        self.faces = []
+
+        # Hidden, unmapped or behind a locked screen: stop ticking entirely
+        self.suspend = suspension_enabled()
+        self.visibility = VisibilityMonitor(self.on_visibility_change)
+        if self.suspend:
+            for detector in session_detectors(self.root): detector.start(self.visibility)
+
+        self.add_face(self.root, checked_style(saved, defaults), position=(saved['x'], saved['y']))
+        for entry in saved['faces']:
+            if isinstance(entry, dict) and isinstance(entry.get('zone'), str):
+                self.add_zone(entry['zone'], checked_style(entry, defaults), position=(entry.get('x'), entry.get('y')))
+        for zone in zones:
+            if zone not in (face.zone for face in self.faces): self.add_zone(zone)
+        if changes:
+            try: self.faces[0].apply(**changes)
+            except ValueError as error: print(f"desktop-clock: ignoring --set: {error}", file=sys.stderr)
+
+        self.sync_info()
+
+        # Everything not needed for the first frame waits for idle time
+        self.root.after_idle(self.apply_os_tweaks)
+        self.root.after_idle(self.build_menu)
+        self.scheduler.start()
+        self.font_cache.warm(self.root)
+        primary = self.faces[0]
+        self.stats = ClockStats(self.root, self.scheduler, primary.renderer, primary.dragger, primary.first_paint,
+                                info=self.info)
+        self.stats.enable_from_env(*self.instrumented())
+        if control: control.serve(self.root, self.handle_command)
+        if run: self.root.mainloop()
+
+    def configure_window(self, window):
+        return self.backend.configure_window(window)
+
+    def add_face(self, window, style, zone=None, position=(None, None)):
+        face = ClockFace(self, window, style, zone)
+        if self.suspend: WindowDetector(window).start(self.visibility)
+        face.refresh_ui()
+        x, y = position
+        if isinstance(x, int) and isinstance(y, int):
+            face.dragger.place(x, y)
+        elif self.faces:
+            below = self.faces[-1]
+            face.dragger.place(below.dragger.x, below.dragger.y + below.wh + 10)
+        else:
+            face.center_window()
+        self.faces.append(face)
+        if self.scheduler.after_id is not None:
+            self.scheduler.run_now(face.date_job)
+        return face
+
+    def add_zone(self, zone, style=None, position=(None, None)):
+        from zoneinfo import ZoneInfo
+        try: ZoneInfo(zone)
+        except (ValueError, LookupError) as error:  # ZoneInfoNotFoundError is a KeyError
+            print(f"desktop-clock: ignoring time zone {zone!r}: {error}", file=sys.stderr)
+            return None
+        return self.add_face(tk.Toplevel(self.root), style or self.faces[0].style(), zone, position)
+
+    def prompt_zone(self):
+        from tkinter import simpledialog
+        zone = simpledialog.askstring("Add Clock", "Time zone (e.g. Europe/London):", parent=self.root)
+        if zone and self.add_zone(zone.strip()): self.save_settings()
+
+    def remove_face(self, face):
+        if face is self.faces[0]: return
+        self.dialogs.close_all()
+        self.faces.remove(face)
+        self.visibility.forget_window(face.root)
+        face.destroy()
+        self.sync_info()
+        self.save_settings()
+
+    def handle_command(self, message):
+        # Control socket and second launches: {"face": 0, "set": {...}, "zones": [...], "quit": false}
+        index, changes, zones = message.get('face', 0), message.get('set') or {}, message.get('zones') or []
+        if type(index) is not int or not 0 <= index < len(self.faces): raise ValueError(f"no clock face {index!r}")
+        if not isinstance(changes, dict): raise ValueError("'set' must be an object")
+        if not isinstance(zones, list) or not all(isinstance(z, str) for z in zones): raise ValueError("'zones' must be a list of names")
+        self.faces[index].apply(**changes)
+        added = [z for z in zones if z not in (face.zone for face in self.faces) and self.add_zone(z)]
+        if added: self.save_settings()
+        if message.get('quit'): self.root.after_idle(self.quit_app)
+        faces = [dict(face.style(), zone=face.zone, x=face.dragger.x, y=face.dragger.y) for face in self.faces]
+        return {'ok': True, 'faces': faces}
+
+    def build_menu(self):
+        if self.menu is not None: return
+        self.menu = tk.Menu(self.root, tearoff=0)
+        self.menu.add_command(label="Browse Fonts", command=lambda: self.dialogs.open(FontPicker, self.menu_face.current_font, self.menu_face.set_font, self.font_cache))
+        self.menu.add_command(label="Edit Time Size", command=lambda: self.menu_face.edit_size())
+        self.menu.add_command(label="Date Settings", command=lambda: self.dialogs.open(DateSettingsWindow, self.menu_face))
+        self.info_vars = {name: tk.BooleanVar() for name in SOURCES}
+        info_menu = tk.Menu(self.menu, tearoff=0)
+        for name, source in SOURCES.items():
+            info_menu.add_checkbutton(label=source.label, variable=self.info_vars[name], command=self.toggle_info)
+        self.menu.add_cascade(label="Info Lines", menu=info_menu)
+        self.menu.add_command(label="Manual Position", command=lambda: self.menu_face.prompt_position())
+        self.menu.add_command(label="Add Time Zone...", command=self.prompt_zone)
+        self.menu.add_command(label="Remove Clock", command=lambda: self.remove_face(self.menu_face))
+        self.menu.add_command(label="Show Stats", command=lambda: self.stats.show(*self.instrumented()))
+        self.menu.add_separator()
+        self.menu.add_command(label="Quit", command=self.quit_app)
+
+    def show_menu(self, event, face):
+        self.build_menu()
+        self.menu_face = face
+        for name, var in self.info_vars.items(): var.set(name in face.info)
+        self.menu.entryconfigure("Remove Clock", state='disabled' if face is self.faces[0] else 'normal')
+        self.menu.post(event.x_root, event.y_root)
+
+    def toggle_info(self):
+        self.menu_face.apply(info=[name for name in SOURCES if self.info_vars[name].get()])
+
+    def sync_info(self):
+        # Sample only what some face shows; each source once, however many faces show it
+        self.info.set_sources([name for name in SOURCES if any(name in face.info for face in self.faces)])
+
+    def on_info(self, changed):
+        # Values change width all the time; keep each clock's aligned edge where it is
+        for face in self.faces:
+            if any(name in changed for name in face.info): face.relayout()
+
+    def instrumented(self):
+        return [(self.faces[0], 'refresh_ui')]
+
+    def apply_os_tweaks(self):
+        self.backend.apply_tweaks([face.root for face in self.faces])
+
+    def save_settings(self, *_):
+        primary = self.faces[0]
+        extra = [dict(face.style(), zone=face.zone, x=face.dragger.x, y=face.dragger.y) for face in self.faces[1:]]
+        self.settings.update(self.root, x=primary.dragger.x, y=primary.dragger.y, faces=extra, **primary.style())
+
+    def quit_app(self):
+        self.info.shutdown()
+        self.settings.flush_pending()
+        self.root.destroy()
+
+    def on_visibility_change(self, visible):
+        if visible: self.scheduler.resume()
+        else: self.scheduler.suspend()
+
+    def update_clock(self):
+        # The single per-minute tick drives every face
+        for face in self.faces: face.update_clock()
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Desktop Clock")
+    parser.add_argument("--zone", action="append", default=[], help="add a clock for this time zone (repeatable)")
+    parser.add_argument("--renderer", choices=sorted(DISPLAYS), help="display backend (default: label)")
+    parser.add_argument("--backend", choices=BACKENDS, help="platform backend (default: this OS)")
+    parser.add_argument("--set", action="append", default=[], metavar="KEY=VALUE", help="change a setting of the first clock (repeatable)")
+    parser.add_argument("--simulate", action="store_true", help="replay --days of ticks on a simulated clock and print a report")
+    from desktop_clock.simulate import add_arguments
+    add_arguments(parser)
+    args = parser.parse_args(argv)
+    try: changes = parse_assignments(args.set)
+    except ValueError as error: parser.error(str(error))
+
+    if args.simulate:
+        # Same app and widgets on a simulated clock; no control socket, settings are read but never written
+        import json
+        from desktop_clock.simulate import FaceProbe, simulate, start_clock
+        time_source = start_clock(args)
+        app = DesktopClock(zones=args.zone, renderer=args.renderer, changes=changes, time_source=time_source, run=False,
+                           backend=args.backend)
+        report = simulate(FaceProbe(app.faces[0]), time_source, args.days, root=app.root)
+        app.root.destroy()
+        print(json.dumps(report, indent=2))
+        sys.exit(1 if report['mismatches'] else 0)
+
+    # A clock is already running: hand it our arguments instead of starting another Tk
+    control = ControlServer()
+    if not control.claim():
+        reply = control.hand_off({'set': changes, 'zones': args.zone})
+        if reply is None: sys.exit("desktop-clock: another instance is running but not answering")
+        if not reply.get('ok'): sys.exit(f"desktop-clock: {reply.get('error')}")
+        sys.exit(0)
+    DesktopClock(zones=args.zone, renderer=args.renderer, changes=changes, control=control, backend=args.backend)
@@ -0,0 +1,23 @@
+import importlib
+import platform
+
+# platform.system() -> backend module; anything else is treated as X11.
+BACKEND_MODULES = {"Darwin": "darwin", "Windows": "windows"}
+BACKENDS = ("darwin", "windows", "x11")
+# Readable without importing a backend module (or Tk), e.g. by the exporter.
+DEFAULT_FONTS = {"darwin": "Didot", "windows": "Arial", "x11": "Didot"}
+
+
+def backend_name(system=None):
+    return BACKEND_MODULES.get(system or platform.system(), "x11")
+
+
+def default_font(name=None):
+    return DEFAULT_FONTS[name or backend_name()]
+
+
+def load_backend(name=None):
+    # Only the running OS's module is imported, so Linux never touches the
+    # Darwin/AppKit paths and vice versa.
+    module = importlib.import_module(f"desktop_clock.backends.{name or backend_name()}")
+    return module.Backend()
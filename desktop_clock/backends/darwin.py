@@ -0,0 +1,27 @@
+import os
+
+from desktop_clock.backends import DEFAULT_FONTS
+
+# Silences the system Tk deprecation warning, which must happen before Tk starts.
+os.environ["TK_SILENCE_DEPRECATION"] = "1"
+
+
+class Backend:
+    name = "darwin"
+    default_font = DEFAULT_FONTS["darwin"]
+    background = "systemTransparent"
+
+    def configure_window(self, window):
+        window.overrideredirect(True)
+        window.config(bg=self.background)
+        window.wm_attributes("-transparent", True)
+        return self.background
+
+    def apply_tweaks(self, windows):
+        # Hide the Dock icon. AppKit is only imported here, after the first frame.
+        try:
+            import AppKit
+            AppKit.NSApplication.sharedApplication().setActivationPolicy_(1)
+            AppKit.NSApp.activateIgnoringOtherApps_(True)
+        except Exception:
+            pass
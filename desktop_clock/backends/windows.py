@@ -0,0 +1,18 @@
+from desktop_clock.backends import DEFAULT_FONTS
+
+
+class Backend:
+    name = "windows"
+    default_font = DEFAULT_FONTS["windows"]
+    background = "black"
+
+    def configure_window(self, window):
+        window.overrideredirect(True)
+        window.config(bg=self.background)
+        window.wm_attributes("-transparentcolor", self.background)
+        return self.background
+
+    def apply_tweaks(self, windows):
+        # overrideredirect windows stay off the taskbar; just don't pin them on top
+        for window in windows:
+            window.attributes("-topmost", False)
@@ -0,0 +1,19 @@
+from desktop_clock.backends import DEFAULT_FONTS
+from desktop_clock.startup import on_first_map
+
+
+class Backend:
+    name = "x11"
+    default_font = DEFAULT_FONTS["x11"]
+    background = "black"
+    alpha = 0.9
+
+    def configure_window(self, window):
+        window.overrideredirect(True)
+        window.config(bg=self.background)
+        # -alpha needs the mapped wrapper window; set it on first map instead of blocking here
+        on_first_map(window, lambda: window.wm_attributes("-alpha", self.alpha))
+        return self.background
+
+    def apply_tweaks(self, windows):
+        pass
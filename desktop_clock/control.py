@@ -0,0 +1,232 @@
+import json
+import os
+import socket
+import sys
+import tempfile
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+ENV_SOCKET = "DESKTOP_CLOCK_SOCKET"
+MAX_MESSAGE = 64 * 1024
+HANDOFF_TIMEOUT = 5.0
+
+
+def available():
+    return hasattr(socket, "AF_UNIX") and fcntl is not None
+
+
+def socket_path():
+    override = os.environ.get(ENV_SOCKET)
+    if override:
+        return override
+    base = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(base, f"desktop-clock-{os.getuid()}.sock")
+
+
+def parse_assignments(pairs):
+    # ["size=90", "show_date=false", "font=Didot"] -> {"size": 90, ...};
+    # values are JSON where they parse as JSON and plain strings otherwise.
+    changes = {}
+    for pair in pairs:
+        key, sep, value = pair.partition("=")
+        if not sep or not key:
+            raise ValueError(f"expected KEY=VALUE, got {pair!r}")
+        try:
+            changes[key] = json.loads(value)
+        except ValueError:
+            changes[key] = value
+    return changes
+
+
+def send(message, path=None, timeout=HANDOFF_TIMEOUT):
+    # Returns the running instance's reply, or None when nothing listens.
+    if not available():
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    with sock:
+        # A timeout or a dropped connection counts as nobody answering
+        try:
+            sock.connect(path or socket_path())
+            sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+            sock.shutdown(socket.SHUT_WR)
+            chunks = []
+            while True:
+                chunk = sock.recv(4096)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        except OSError:
+            return None
+    data = b"".join(chunks)
+    try:
+        return json.loads(data) if data else {}
+    except ValueError:
+        return None
+
+
+class ControlServer:
+    # Single-instance lock plus a Unix socket served from the Tk event loop.
+    # claim() runs before the Tk root exists, so a second launch can hand its
+    # arguments over without ever starting an interpreter of its own.
+
+    def __init__(self, path=None):
+        # Without Unix sockets (Windows) there is no path, and claim() always wins
+        self.path = path or (socket_path() if available() else None)
+        self.sock = None
+        self.root = None
+        self.handler = None
+        self.requests = 0
+        self._lock = None
+        self._buffers = {}
+
+    def claim(self):
+        if not available():
+            return True
+        lock = open(f"{self.path}.lock", "a")
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock.close()
+            return False
+        self._lock = lock
+        # Holding the lock means any socket file left behind is stale
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.bind(self.path)
+            os.chmod(self.path, 0o600)
+            sock.listen(8)
+        except OSError as error:
+            sock.close()
+            print(f"desktop-clock: control socket disabled: {error}", file=sys.stderr)
+            return True
+        sock.setblocking(False)
+        self.sock = sock
+        return True
+
+    def hand_off(self, message, timeout=HANDOFF_TIMEOUT):
+        # The lock holder may still be starting up; keep knocking briefly.
+        deadline = time.monotonic() + timeout
+        while True:
+            reply = send(message, self.path, timeout)
+            if reply is not None or time.monotonic() >= deadline:
+                return reply
+            time.sleep(0.1)
+
+    def serve(self, root, handler):
+        self.root = root
+        self.handler = handler
+        if self.sock is None:
+            return
+        # Tk only comes in here: the client side (send, the CLI, the exporter's
+        # --set parsing) works without it
+        from tkinter import READABLE
+        root.tk.createfilehandler(self.sock, READABLE, self._accept)
+        root.bind("<Destroy>", lambda e: e.widget is root and self.close(), add="+")
+
+    def _accept(self, _sock, _mask):
+        try:
+            conn, _ = self.sock.accept()
+        except OSError:
+            return
+        conn.setblocking(False)
+        self._buffers[conn] = bytearray()
+        from tkinter import READABLE
+        self.root.tk.createfilehandler(conn, READABLE, self._read)
+
+    def _read(self, conn, _mask):
+        buffer = self._buffers[conn]
+        try:
+            chunk = conn.recv(4096)
+        except BlockingIOError:
+            return
+        except OSError:
+            chunk = b""
+        buffer.extend(chunk)
+        if chunk and b"\n" not in chunk and len(buffer) < MAX_MESSAGE:
+            return
+        self._finish(conn, bytes(buffer).split(b"\n", 1)[0])
+
+    def _finish(self, conn, data):
+        self.root.tk.deletefilehandler(conn)
+        del self._buffers[conn]
+        try:
+            message = json.loads(data)
+            if not isinstance(message, dict):
+                raise ValueError("expected a JSON object")
+            reply = self.handler(message)
+        except ValueError as error:
+            reply = {"ok": False, "error": str(error)}
+        except Exception as error:
+            # Whatever went wrong, the client gets a reply and the socket is closed
+            reply = {"ok": False, "error": f"internal error: {error!r}"}
+        self.requests += 1
+        try:
+            conn.setblocking(True)
+            conn.settimeout(1.0)
+            conn.sendall(json.dumps(reply).encode("utf-8"))
+        except OSError:
+            pass
+        finally:
+            conn.close()
+
+    def close(self):
+        from tkinter import TclError
+        for conn in list(self._buffers):
+            try:
+                self.root.tk.deletefilehandler(conn)
+            except TclError:
+                pass
+            conn.close()
+        self._buffers.clear()
+        if self.sock is not None:
+            try:
+                self.root.tk.deletefilehandler(self.sock)
+            except TclError:
+                pass
+            self.sock.close()
+            self.sock = None
+            try:
+                os.unlink(self.path)
+            except OSError:
+                pass
+        if self._lock is not None:
+            self._lock.close()
+            self._lock = None
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(
+        prog="python -m desktop_clock.control",
+        description="Reconfigure a running Desktop Clock",
+    )
+    parser.add_argument("settings", nargs="*", metavar="KEY=VALUE",
+                        help="font, size, show_date, date_align, date_ratio, lang, x, y")
+    parser.add_argument("--face", type=int, default=0, help="clock face to change (default: 0)")
+    parser.add_argument("--zone", action="append", default=[], help="add a time-zone clock")
+    parser.add_argument("--quit", action="store_true", help="close the running clock")
+    args = parser.parse_args(argv)
+    try:
+        changes = parse_assignments(args.settings)
+    except ValueError as error:
+        parser.error(str(error))
+    message = {"face": args.face, "set": changes, "zones": args.zone, "quit": args.quit}
+    reply = send(message)
+    if reply is None:
+        print("desktop-clock: no running clock", file=sys.stderr)
+        return 1
+    print(json.dumps(reply, indent=2))
+    return 0 if reply.get("ok") else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+# A closed dialog stays withdrawn this long before its widgets are freed.
+IDLE_TIMEOUT_MS = 5 * 60 * 1000
+
+
+class DialogPool:
+    # One instance per dialog class. Closing withdraws the window; opening
+    # again deiconifies it and calls resync(*args) with the same arguments
+    # the constructor took, so the controls follow the current clock state.
+
+    def __init__(self, root, idle_timeout_ms=IDLE_TIMEOUT_MS):
+        self.root = root
+        self.idle_timeout_ms = idle_timeout_ms
+        self.dialogs = {}
+        self.timers = {}
+        self.builds = 0
+        self.reuses = 0
+        self.teardowns = 0
+
+    def open(self, dialog_class, *args):
+        self._cancel_timer(dialog_class)
+        dialog = self.dialogs.get(dialog_class)
+        if dialog is not None and dialog.winfo_exists():
+            dialog.resync(*args)
+            self.reuses += 1
+        else:
+            dialog = dialog_class(self.root, *args)
+            dialog.protocol("WM_DELETE_WINDOW", lambda: self.close(dialog_class))
+            self.dialogs[dialog_class] = dialog
+            self.builds += 1
+        dialog.deiconify()
+        dialog.lift()
+        return dialog
+
+    def close(self, dialog_class):
+        dialog = self.dialogs.get(dialog_class)
+        if dialog is None:
+            return
+        release = getattr(dialog, "release", None)
+        if release is not None:
+            release()
+        dialog.withdraw()
+        self._cancel_timer(dialog_class)
+        self.timers[dialog_class] = self.root.after(
+            self.idle_timeout_ms, lambda: self.teardown(dialog_class)
+        )
+
+    def close_all(self):
+        for dialog_class, dialog in list(self.dialogs.items()):
+            if dialog.winfo_exists() and dialog.state() != "withdrawn":
+                self.close(dialog_class)
+
+    def teardown(self, dialog_class):
+        self._cancel_timer(dialog_class)
+        dialog = self.dialogs.pop(dialog_class, None)
+        if dialog is not None and dialog.winfo_exists():
+            dialog.destroy()
+            self.teardowns += 1
+
+    def _cancel_timer(self, dialog_class):
+        after_id = self.timers.pop(dialog_class, None)
+        if after_id is not None:
+            self.root.after_cancel(after_id)
+
+    def stats(self):
+        return {
+            "builds": self.builds,
+            "reuses": self.reuses,
+            "teardowns": self.teardowns,
+            "alive": len(self.dialogs),
+        }
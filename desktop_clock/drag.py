@@ -0,0 +1,55 @@
+# One geometry update per ~60 Hz frame, however fast the mouse reports.
+FRAME_MS = 16
+
+
+class WindowDragger:
+    def __init__(self, root, on_commit=None):
+        self.root = root
+        self.on_commit = on_commit
+        self.x = 0
+        self.y = 0
+        self.events = 0
+        self.geometry_calls = 0
+        self.after_id = None
+        self._pointer = None
+        self._origin = None
+
+    def place(self, x, y):
+        self.x, self.y = x, y
+        self._apply()
+
+    def start(self, event):
+        # The only server query of the drag; motion works from here on.
+        self.x, self.y = self.root.winfo_x(), self.root.winfo_y()
+        self._origin = (self.x, self.y)
+        self._pointer = (event.x_root, event.y_root)
+
+    def motion(self, event):
+        self.events += 1
+        if self._pointer is None:
+            return
+        self.x = self._origin[0] + event.x_root - self._pointer[0]
+        self.y = self._origin[1] + event.y_root - self._pointer[1]
+        if self.after_id is None:
+            self.after_id = self.root.after(FRAME_MS, self._flush)
+
+    def release(self, event):
+        if self._pointer is None:
+            return
+        self.motion(event)
+        self.root.after_cancel(self.after_id)
+        self._flush()
+        self._pointer = None
+        if self.on_commit:
+            self.on_commit(self.x, self.y)
+
+    def _flush(self):
+        self.after_id = None
+        self._apply()
+
+    def _apply(self):
+        self.root.geometry(f"+{self.x}+{self.y}")
+        self.geometry_calls += 1
+
+    def stats(self):
+        return {"events": self.events, "geometry_calls": self.geometry_calls}
@@ -0,0 +1,328 @@
+import io
+import json
+import os
+import sys
+import time
+from collections import OrderedDict
+
+from desktop_clock.backends import BACKENDS, default_font
+from desktop_clock.glyphs import load_font, pillow_available
+from desktop_clock.layout import anchor_for, date_font_size, window_size
+from desktop_clock.localization import date_formatter
+from desktop_clock.scheduler import WAKE_SLACK_MS, next_minute
+from desktop_clock.settings import DEFAULT_STYLE, SETTING_CHECKS, SettingsStore, checked_style, write_atomic
+from desktop_clock.timing import Timing
+from desktop_clock.timesource import SYSTEM_CLOCK
+
+FORMATS = ("png", "ppm")
+# Tk's default scaling: a point size becomes this many pixels per 72.
+DEFAULT_DPI = 96
+# Encoded frames kept for reuse, in bytes. Only frames without the date are
+# kept: those come round again every day (1440 of them, ~17 KB each at the
+# default size), while a frame with the date never repeats.
+MAX_FRAME_BYTES = 16 * 1024 * 1024
+# Frames replayed with --start when --count is not given.
+REPLAY_FRAMES = 1440
+# Settings a frame has no use for: info lines change on their own schedule,
+# not with the minute, and x/y place a window.
+NOT_EXPORTED = ("info", "x", "y")
+# Pillow text anchors for each canvas anchor (x placement, ascender top).
+TEXT_ANCHORS = {"w": "la", "e": "ra", "center": "ma"}
+
+
+class PillowMetrics:
+    # The TextMetrics interface over Pillow fonts, so window_size() lays a
+    # frame out exactly as it lays out a window.
+
+    def __init__(self, dpi=DEFAULT_DPI, max_fonts=8):
+        self.dpi = dpi
+        self.max_fonts = max_fonts
+        self._fonts = OrderedDict()
+        self._extents = {}
+
+    def font(self, family, size, weight):
+        key = (family, size, weight)
+        font = self._fonts.get(key)
+        if font is None:
+            pixels = max(1, round(size * self.dpi / 72))
+            font = load_font(family, pixels, weight == "bold")
+            if font is None:
+                from PIL import ImageFont
+                font = ImageFont.load_default(pixels)
+            self._fonts[key] = font
+            if len(self._fonts) > self.max_fonts:
+                self._fonts.popitem(last=False)
+        else:
+            self._fonts.move_to_end(key)
+        return font
+
+    def extent(self, family, size, weight, text):
+        key = (family, size, weight, text)
+        extent = self._extents.get(key)
+        if extent is None:
+            font = self.font(family, size, weight)
+            ascent, descent = font.getmetrics()
+            lines = text.split("\n")
+            extent = (
+                max(round(font.getlength(line)) for line in lines),
+                (ascent + descent) * len(lines)
+            )
+            if len(self._extents) >= 256:
+                self._extents.clear()
+            self._extents[key] = extent
+        return extent
+
+
+class FrameRenderer:
+    # Lays out and encodes one frame per (time, date) pair, with the same
+    # padding and anchoring as CanvasDisplay. The date line is drawn once per
+    # day and pasted under each minute; date-less frames are kept, encoded,
+    # up to a byte budget.
+    padding = (6, 6)
+
+    def __init__(self, style, image_format="png", background="black", colour="white",
+                 dpi=DEFAULT_DPI, max_frame_bytes=MAX_FRAME_BYTES):
+        self.style = style
+        self.image_format = image_format
+        self.background = background
+        self.colour = colour
+        self.metrics = PillowMetrics(dpi)
+        self.max_frame_bytes = max_frame_bytes
+        self.frames = {}
+        self.frame_bytes = 0
+        self.date_layers = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.render_timing = Timing()
+        self.hit_timing = Timing()
+
+    def frame(self, time_text, date_text):
+        # -> (encoded bytes, seconds spent, served from the cache)
+        started = time.perf_counter()
+        key = (time_text, date_text)
+        data = self.frames.get(key)
+        cached = data is not None
+        if cached:
+            self.hits += 1
+        else:
+            self.misses += 1
+            data = self._encode(self._draw(time_text, date_text))
+            if not self.style["show_date"]:
+                self._keep(key, data)
+        elapsed = time.perf_counter() - started
+        (self.hit_timing if cached else self.render_timing).add(elapsed)
+        return data, elapsed, cached
+
+    def _keep(self, key, data):
+        # Minutes come round in the same order every day, so evicting the
+        # oldest would leave nothing to hit; a full cache keeps what it has.
+        if self.frame_bytes + len(data) <= self.max_frame_bytes:
+            self.frames[key] = data
+            self.frame_bytes += len(data)
+
+    def _draw(self, time_text, date_text):
+        from PIL import Image, ImageDraw
+
+        style = self.style
+        family, size, ratio = style["font"], style["size"], style["date_ratio"]
+        show_date = style["show_date"]
+        anchor = anchor_for(style["date_align"])
+        pad_x, pad_y = self.padding
+        width, height = window_size(self.metrics, family, size, time_text, date_text, ratio,
+                                    show_date, self.padding)
+        x = {"w": pad_x // 2, "e": width - pad_x // 2}.get(anchor, width // 2)
+        time_height = self.metrics.extent(family, size, "bold", time_text)[1]
+
+        image = Image.new("RGB", (width, height), self.background)
+        ImageDraw.Draw(image).text(
+            (x, pad_y // 2), time_text, font=self.metrics.font(family, size, "bold"),
+            fill=self.colour, anchor=TEXT_ANCHORS[anchor]
+        )
+        if show_date:
+            layer = self._date_layer(family, date_font_size(size, ratio), date_text)
+            date_x = {"w": pad_x // 2, "e": width - pad_x // 2 - layer.width}.get(
+                anchor, (width - layer.width) // 2
+            )
+            image.paste(layer, (date_x, time_height + pad_y + pad_y // 2))
+        return image
+
+    def _date_layer(self, family, size, date_text):
+        from PIL import Image, ImageDraw
+
+        key = (family, size, date_text)
+        layer = self.date_layers.get(key)
+        if layer is None:
+            width, height = self.metrics.extent(family, size, "normal", date_text)
+            layer = Image.new("RGB", (max(1, width), height), self.background)
+            ImageDraw.Draw(layer).text((0, 0), date_text, fill=self.colour, anchor="la",
+                                       font=self.metrics.font(family, size, "normal"))
+            self.date_layers[key] = layer
+            # Yesterday's and today's are enough across midnight
+            if len(self.date_layers) > 2:
+                self.date_layers.popitem(last=False)
+        return layer
+
+    def _encode(self, image):
+        buffer = io.BytesIO()
+        image.save(buffer, self.image_format.upper())
+        return buffer.getvalue()
+
+    def stats(self):
+        return {
+            "frames_cached": len(self.frames),
+            "frame_bytes": self.frame_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "render": self.render_timing.as_dict(),
+            "cache_hit": self.hit_timing.as_dict(),
+        }
+
+
+class DirectorySink:
+    # One file per frame named after the minute it shows, plus latest.<ext>
+    # replaced atomically so a player polling it never reads half a frame.
+
+    def __init__(self, path, image_format):
+        self.path = path
+        self.image_format = image_format
+        os.makedirs(path, exist_ok=True)
+
+    def write(self, data, when):
+        name = time.strftime("clock-%Y%m%d-%H%M", when) + f".{self.image_format}"
+        write_atomic(os.path.join(self.path, name), data)
+        write_atomic(os.path.join(self.path, f"latest.{self.image_format}"), data)
+        return name
+
+
+class StreamSink:
+    # Frames back to back on a binary stream (ffmpeg -f image2pipe, ...).
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, data, when):
+        self.stream.write(data)
+        self.stream.flush()
+        return None
+
+
+class FrameExporter:
+    # The clock's tick without a window: each wakeup formats the time and
+    # date, and a frame goes out only when either text changed.
+
+    def __init__(self, style, renderer, sink, time_source=SYSTEM_CLOCK, report=None):
+        self.style = style
+        self.renderer = renderer
+        self.sink = sink
+        self.time_source = time_source
+        self.report = report
+        self.format_date = date_formatter(style["lang"])
+        self.shown = None
+        self.written = 0
+        self.wakeups = 0
+
+    def tick(self):
+        # -> True when a frame was written
+        self.wakeups += 1
+        now = self.time_source.localtime()
+        time_text = time.strftime("%H:%M", now)
+        date_text = self.format_date(now) if self.style["show_date"] else ""
+        if (time_text, date_text) == self.shown:
+            return False
+        data, elapsed, cached = self.renderer.frame(time_text, date_text)
+        name = self.sink.write(data, now)
+        self.shown = (time_text, date_text)
+        self.written += 1
+        if self.report is not None:
+            entry = {"frame": self.written, "time": time.strftime("%Y-%m-%dT%H:%M", now),
+                     "render_ms": round(elapsed * 1000, 3), "cached": cached, "bytes": len(data)}
+            if name:
+                entry["file"] = name
+            print(json.dumps(entry), file=self.report, flush=True)
+        return True
+
+    def run(self, count=None):
+        # Sleep to just past each minute; a simulated clock is advanced instead.
+        while True:
+            self.tick()
+            if count is not None and self.written >= count:
+                return
+            now = self.time_source.time()
+            wait = next_minute(now) - now + WAKE_SLACK_MS / 1000
+            if self.time_source.simulated:
+                self.time_source.advance(wait)
+            else:
+                time.sleep(wait)
+
+    def stats(self):
+        return dict(self.renderer.stats(), written=self.written, wakeups=self.wakeups)
+
+
+def load_style(changes, backend=None):
+    # The saved style of the first clock (read, never written), then --set.
+    defaults = dict(DEFAULT_STYLE, font=default_font(backend))
+    style = checked_style(SettingsStore(persist=False).load(defaults), defaults)
+    for key, value in changes.items():
+        if key in NOT_EXPORTED:
+            raise ValueError(f"{key} is not supported in exported frames")
+        if key not in defaults:
+            raise ValueError(f"unknown setting {key!r}")
+        if not SETTING_CHECKS[key](value):
+            raise ValueError(f"invalid {key}: {value!r}")
+    style.update(changes)
+    return style
+
+
+def main(argv=None):
+    import argparse
+    from desktop_clock.control import parse_assignments
+    from desktop_clock.simulate import parse_start, use_timezone
+    from desktop_clock.timesource import SimulatedClock
+
+    parser = argparse.ArgumentParser(
+        prog="python -m desktop_clock.export",
+        description="Render clock frames without a window, one per minute or date change",
+    )
+    output = parser.add_mutually_exclusive_group(required=True)
+    output.add_argument("--out", metavar="DIR", help="write numbered frames and latest.<format> here")
+    output.add_argument("--stdout", action="store_true", help="stream frames back to back on stdout")
+    parser.add_argument("--format", choices=FORMATS, default="png", help="image format (default: png)")
+    parser.add_argument("--set", action="append", default=[], metavar="KEY=VALUE",
+                        help="override a saved setting (repeatable)")
+    parser.add_argument("--backend", choices=BACKENDS, help="take the default font from this platform backend")
+    parser.add_argument("--background", default="black", help="frame background (default: black)")
+    parser.add_argument("--colour", default="white", help="text colour (default: white)")
+    parser.add_argument("--dpi", type=int, default=DEFAULT_DPI, help=f"pixels per inch (default: {DEFAULT_DPI})")
+    parser.add_argument("--count", type=int, help="stop after this many frames")
+    parser.add_argument("--once", action="store_true", help="write the current frame and exit")
+    parser.add_argument("--start", help="replay from YYYY-MM-DD[THH:MM] on a simulated clock, without waiting")
+    parser.add_argument("--tz", help="render local time in this time zone, e.g. Europe/Istanbul")
+    parser.add_argument("--quiet", action="store_true", help="no per-frame report on stderr")
+    args = parser.parse_args(argv)
+
+    if not pillow_available():
+        sys.exit("desktop-clock export: Pillow is required (pip install pillow)")
+    try:
+        style = load_style(parse_assignments(args.set), args.backend)
+    except ValueError as error:
+        parser.error(str(error))
+
+    if args.tz:
+        use_timezone(args.tz)
+    time_source = SimulatedClock(parse_start(args.start)) if args.start else SYSTEM_CLOCK
+    count = 1 if args.once else args.count
+    if count is None and args.start:
+        count = REPLAY_FRAMES
+    sink = StreamSink(sys.stdout.buffer) if args.stdout else DirectorySink(args.out, args.format)
+    renderer = FrameRenderer(style, args.format, args.background, args.colour, args.dpi)
+    exporter = FrameExporter(style, renderer, sink, time_source, None if args.quiet else sys.stderr)
+    try:
+        exporter.run(count)
+    except KeyboardInterrupt:
+        pass
+    print(json.dumps({"summary": exporter.stats()}), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
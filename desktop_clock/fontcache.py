@@ -0,0 +1,101 @@
+import hashlib
+import json
+import os
+import platform
+
+from desktop_clock.fontsearch import FontIndex
+from desktop_clock.settings import write_atomic
+
+CACHE_VERSION = 1
+
+
+def user_cache_dir():
+    system = platform.system()
+    home = os.path.expanduser("~")
+    if system == "Darwin":
+        base = os.path.join(home, "Library", "Caches")
+    elif system == "Windows":
+        base = os.environ.get("LOCALAPPDATA") or os.path.join(home, "AppData", "Local")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(home, ".cache")
+    return os.path.join(base, "desktop-clock")
+
+
+def font_dirs():
+    system = platform.system()
+    home = os.path.expanduser("~")
+    if system == "Darwin":
+        return ["/System/Library/Fonts", "/Library/Fonts",
+                os.path.join(home, "Library", "Fonts")]
+    if system == "Windows":
+        windir = os.environ.get("WINDIR", r"C:\Windows")
+        local = os.environ.get("LOCALAPPDATA") or os.path.join(home, "AppData", "Local")
+        return [os.path.join(windir, "Fonts"),
+                os.path.join(local, "Microsoft", "Windows", "Fonts")]
+    data_home = os.environ.get("XDG_DATA_HOME") or os.path.join(home, ".local", "share")
+    return ["/usr/share/fonts", "/usr/local/share/fonts", "/etc/fonts",
+            os.path.join(data_home, "fonts"), os.path.join(home, ".fonts")]
+
+
+def font_fingerprint(dirs=None):
+    # Same idea fontconfig uses: adding or removing a font file bumps the
+    # mtime of its directory, so hashing directory mtimes is enough.
+    digest = hashlib.sha1()
+    stack = list(dirs if dirs is not None else font_dirs())
+    while stack:
+        path = stack.pop()
+        try:
+            stat = os.stat(path)
+            entries = list(os.scandir(path))
+        except OSError:
+            continue
+        digest.update(f"{path}\0{stat.st_mtime_ns}\0".encode("utf-8", "surrogateescape"))
+        for entry in entries:
+            try:
+                if entry.is_dir():
+                    stack.append(entry.path)
+            except OSError:
+                pass
+    return digest.hexdigest()
+
+
+class FontFamilyCache:
+    def __init__(self, path=None):
+        self.path = path or os.path.join(user_cache_dir(), "font-families.json")
+        self._families = None
+        self._index = None
+
+    def warm(self, root):
+        root.after_idle(lambda: self.index(root))
+
+    def families(self, root):
+        if self._families is None:
+            self._families = self._load(root)
+        return self._families
+
+    def index(self, root):
+        if self._index is None:
+            self._index = FontIndex(self.families(root))
+        return self._index
+
+    def _load(self, root):
+        stamp = f"{root.tk.call('info', 'patchlevel')}:{font_fingerprint()}"
+        try:
+            with open(self.path, encoding="utf-8") as handle:
+                cached = json.load(handle)
+            if cached.get("version") == CACHE_VERSION and cached.get("stamp") == stamp:
+                return cached["families"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+
+        from tkinter import font
+        families = sorted(font.families(root))
+        self._save({"version": CACHE_VERSION, "stamp": stamp, "families": families})
+        return families
+
+    def _save(self, data):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            write_atomic(self.path, json.dumps(data).encode("utf-8"))
+        except OSError:
+            pass
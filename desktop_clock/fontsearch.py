@@ -0,0 +1,69 @@
+class FontIndex:
+    # Lowercased names plus a bigram -> row index, so a fresh query only
+    # scans the rows sharing its rarest bigram, and a query that contains
+    # the previous one only re-checks the previous matches.
+
+    def __init__(self, families):
+        self.families = list(families)
+        self.lowered = [name.lower() for name in self.families]
+        self.bigrams = {}
+        for row, name in enumerate(self.lowered):
+            for gram in {name[i:i + 2] for i in range(len(name) - 1)}:
+                self.bigrams.setdefault(gram, []).append(row)
+        self._last_query = ""
+        self._last_rows = list(range(len(self.families)))
+
+    def _candidates(self, query):
+        if self._last_query and self._last_query in query:
+            return self._last_rows
+        if len(query) < 2:
+            return range(len(self.families))
+        grams = {query[i:i + 2] for i in range(len(query) - 1)}
+        return min((self.bigrams.get(gram, ()) for gram in grams), key=len)
+
+    def search(self, query):
+        query = query.lower()
+        if not query:
+            rows = list(range(len(self.families)))
+        else:
+            lowered = self.lowered
+            rows = [row for row in self._candidates(query) if query in lowered[row]]
+        self._last_query = query
+        self._last_rows = rows
+        return [self.families[row] for row in rows]
+
+
+class FontListView:
+    # Debounces keystrokes and swaps the listbox contents in one bulk call.
+
+    def __init__(self, listbox, index, delay_ms=30):
+        self.listbox = listbox
+        self.index = index
+        self.delay_ms = delay_ms
+        self.after_id = None
+        self.shown = None
+        self._query = ""
+
+    def request(self, query):
+        self._query = query
+        if self.after_id is not None:
+            self.listbox.after_cancel(self.after_id)
+        self.after_id = self.listbox.after(self.delay_ms, self.flush)
+
+    def flush(self):
+        self.after_id = None
+        matches = self.index.search(self._query)
+        if matches == self.shown:
+            return
+        self.listbox.delete(0, "end")
+        if matches:
+            self.listbox.insert("end", *matches)
+        self.shown = matches
+
+    def select(self, name):
+        # Programmatic selection does not fire <<ListboxSelect>>
+        self.listbox.selection_clear(0, "end")
+        if self.shown and name in self.shown:
+            position = self.shown.index(name)
+            self.listbox.selection_set(position)
+            self.listbox.see(position)
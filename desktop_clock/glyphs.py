@@ -0,0 +1,130 @@
+import base64
+import io
+import shutil
+import subprocess
+from collections import OrderedDict
+from functools import lru_cache
+
+GLYPHS = "0123456789:"
+
+# Distinct (font, size, colour) atlases kept alive; rebuilding one only
+# happens after a font, size or colour change.
+MAX_ATLASES = 4
+
+# (family, bold) -> font file Pillow could open, or None; fc-match runs
+# once per family instead of once per size.
+_FONT_PATHS = {}
+
+
+@lru_cache(maxsize=None)
+def pillow_available():
+    # Pillow is only imported once something is actually drawn with it.
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _font_files(family, bold):
+    if shutil.which("fc-match"):
+        pattern = f"{family}:weight=bold" if bold else family
+        try:
+            path = subprocess.run(
+                ["fc-match", "-f", "%{file}", pattern],
+                capture_output=True, text=True, timeout=2
+            ).stdout.strip()
+        except (OSError, subprocess.SubprocessError):
+            path = ""
+        if path:
+            yield path
+    # Windows and macOS: Pillow searches the system font dirs by file name.
+    stem = family.replace(" ", "")
+    if bold:
+        yield f"{family} Bold.ttf"
+        yield f"{stem}-Bold.ttf"
+    yield f"{family}.ttf"
+    yield f"{family}.ttc"
+    yield f"{stem}.ttf"
+
+
+def font_path(family, bold=True):
+    from PIL import ImageFont
+
+    key = (family, bold)
+    if key not in _FONT_PATHS:
+        _FONT_PATHS[key] = None
+        for path in _font_files(family, bold):
+            try:
+                ImageFont.truetype(path, 12)
+            except OSError:
+                continue
+            _FONT_PATHS[key] = path
+            break
+    return _FONT_PATHS[key]
+
+
+def load_font(family, pixels, bold=True):
+    from PIL import ImageFont
+
+    path = font_path(family, bold)
+    return ImageFont.truetype(path, pixels) if path is not None else None
+
+
+class GlyphAtlas:
+    def __init__(self, root, font, colour):
+        import tkinter as tk
+        from PIL import Image, ImageDraw
+
+        ascent, descent = font.getmetrics()
+        self.height = ascent + descent
+        self.images = {}
+        widths = {}
+        for char in GLYPHS:
+            width = max(1, round(font.getlength(char)))
+            image = Image.new("RGBA", (width, self.height), (0, 0, 0, 0))
+            ImageDraw.Draw(image).text((0, 0), char, font=font, fill=colour)
+            buffer = io.BytesIO()
+            image.save(buffer, "PNG")
+            self.images[char] = tk.PhotoImage(
+                master=root, data=base64.b64encode(buffer.getvalue()).decode("ascii")
+            )
+            widths[char] = width
+
+        # Digits share one slot width so the line never shifts between minutes.
+        digit_width = max(widths[char] for char in "0123456789")
+        self.slot_widths = {
+            char: digit_width if char.isdigit() else widths[char] for char in GLYPHS
+        }
+
+    def covers(self, text):
+        return all(char in self.images for char in text)
+
+
+class GlyphCache:
+    def __init__(self, maxsize=MAX_ATLASES):
+        self.maxsize = maxsize
+        self.builds = 0
+        self._atlases = OrderedDict()
+
+    def get(self, root, family, size, colour):
+        if not pillow_available():
+            return None
+        scaling = float(root.tk.call("tk", "scaling"))
+        key = (family, size, colour, scaling)
+        if key in self._atlases:
+            self._atlases.move_to_end(key)
+            return self._atlases[key]
+
+        # Tk sizes are points; negative sizes are already pixels.
+        pixels = -size if size < 0 else round(size * scaling)
+        font = load_font(family, pixels)
+        atlas = GlyphAtlas(root, font, colour) if font is not None else None
+        self.builds += 1
+        self._atlases[key] = atlas
+        if len(self._atlases) > self.maxsize:
+            self._atlases.popitem(last=False)
+        return atlas
+
+
+GLYPH_CACHE = GlyphCache()
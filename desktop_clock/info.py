@@ -0,0 +1,230 @@
+import os
+import queue
+import time
+
+from desktop_clock.scheduler import every
+from desktop_clock.timing import Timing
+
+# A finished sample is picked up this soon; with nothing in flight there
+# is no drain timer at all.
+DRAIN_MS = 50
+MAX_WORKERS = 2
+
+
+class InfoSource:
+    # sample() runs on a worker thread and returns the line to show, or
+    # None when the value is unavailable (no battery, not Linux, ...).
+    name = ""
+    label = ""
+    interval = 10
+
+    def sample(self):
+        raise NotImplementedError
+
+
+class LoadSource(InfoSource):
+    name, label, interval = "load", "CPU Load", 5
+
+    def sample(self):
+        try:
+            with open("/proc/loadavg") as handle:
+                load = float(handle.read().split()[0])
+        except (OSError, ValueError, IndexError):
+            try:
+                load = os.getloadavg()[0]
+            except (OSError, AttributeError):
+                return None
+        return f"Load {load:.2f}"
+
+
+class MemorySource(InfoSource):
+    name, label, interval = "memory", "Memory", 10
+
+    def sample(self):
+        fields = {}
+        try:
+            with open("/proc/meminfo") as handle:
+                for line in handle:
+                    key, _, rest = line.partition(":")
+                    if key in ("MemTotal", "MemAvailable"):
+                        fields[key] = int(rest.split()[0])
+        except (OSError, ValueError, IndexError):
+            return None
+        if len(fields) < 2 or not fields["MemTotal"]:
+            return None
+        used = 100 - fields["MemAvailable"] * 100 // fields["MemTotal"]
+        return f"Memory {used}%"
+
+
+class BatterySource(InfoSource):
+    name, label, interval = "battery", "Battery", 60
+    ROOT = "/sys/class/power_supply"
+
+    def sample(self):
+        try:
+            supplies = sorted(os.listdir(self.ROOT))
+        except OSError:
+            return None
+        for supply in supplies:
+            path = os.path.join(self.ROOT, supply)
+            try:
+                with open(os.path.join(path, "type")) as handle:
+                    if handle.read().strip() != "Battery":
+                        continue
+                with open(os.path.join(path, "capacity")) as handle:
+                    capacity = int(handle.read())
+                with open(os.path.join(path, "status")) as handle:
+                    status = handle.read().strip()
+            except (OSError, ValueError):
+                continue
+            return f"Battery {capacity}%" + (" (charging)" if status == "Charging" else "")
+        return None
+
+
+class UptimeSource(InfoSource):
+    name, label, interval = "uptime", "Uptime", 60
+
+    def sample(self):
+        try:
+            with open("/proc/uptime") as handle:
+                seconds = int(float(handle.read().split()[0]))
+        except (OSError, ValueError, IndexError):
+            return None
+        days, rest = divmod(seconds, 86400)
+        hours, rest = divmod(rest, 3600)
+        if days:
+            return f"Up {days}d {hours}h"
+        return f"Up {hours}h {rest // 60}m"
+
+
+class FakeSource(InfoSource):
+    # Scripted values, optionally slow, for tests and benchmarks.
+
+    def __init__(self, name, values, interval=1, delay=0.0):
+        self.name = self.label = name
+        self.values = list(values)
+        self.interval = interval
+        self.delay = delay
+        self.calls = 0
+
+    def sample(self):
+        if self.delay:
+            time.sleep(self.delay)
+        value = self.values[self.calls % len(self.values)]
+        self.calls += 1
+        return value
+
+
+SOURCES = {source.name: source for source in (LoadSource, MemorySource, BatterySource, UptimeSource)}
+
+
+class InfoSampler:
+    # Every source is a job on the clock's TickScheduler, so sources with
+    # related periods share a wakeup and nothing samples while the clock is
+    # suspended. The sampling itself runs on a small shared thread pool;
+    # results come back through a queue that one after() callback drains
+    # on the Tk thread, and on_change only hears about values that differ.
+
+    def __init__(self, scheduler, on_change, max_workers=MAX_WORKERS):
+        self.scheduler = scheduler
+        # Drains run on the scheduler's timer, so simulated time drives them too
+        self.timer = scheduler.timer
+        self.on_change = on_change
+        self.max_workers = max_workers
+        self.sources = {}
+        self.jobs = {}
+        self.values = {}
+        self.timings = {}
+        self.errors = 0
+        self.drains = 0
+        self.in_flight = set()
+        self.results = queue.SimpleQueue()
+        self.drain_id = None
+        self._executor = None
+
+    def set_sources(self, names):
+        for name in list(self.sources):
+            if name not in names:
+                self.remove(name)
+        for name in names:
+            if name not in self.sources:
+                self.add(SOURCES[name]())
+
+    def add(self, source):
+        def sample_job():
+            self._submit(source)
+
+        sample_job.__name__ = f"sample_{source.name}"
+        self.sources[source.name] = source
+        self.timings.setdefault(source.name, Timing())
+        self.jobs[source.name] = self.scheduler.add_job(sample_job, every(source.interval))
+        # Not started yet (or suspended): start()/resume() will run it
+        if self.scheduler.after_id is not None:
+            self.scheduler.run_now(self.jobs[source.name])
+
+    def remove(self, name):
+        self.scheduler.remove_job(self.jobs.pop(name))
+        del self.sources[name]
+        self.values.pop(name, None)
+
+    def _submit(self, source):
+        # A slow source never queues up behind itself
+        if source.name in self.in_flight:
+            return
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="clock-info")
+        self.in_flight.add(source.name)
+        self._executor.submit(self._sample, source)
+        if self.drain_id is None:
+            self.drain_id = self.timer.after(DRAIN_MS, self._drain)
+
+    def _sample(self, source):
+        # Worker thread: touch nothing but the source and the queue
+        started = time.perf_counter()
+        try:
+            value, failed = source.sample(), False
+        except Exception:
+            value, failed = None, True
+        self.results.put((source.name, value, time.perf_counter() - started, failed))
+
+    def _drain(self):
+        self.drain_id = None
+        self.drains += 1
+        changed = {}
+        while True:
+            try:
+                name, value, elapsed, failed = self.results.get_nowait()
+            except queue.Empty:
+                break
+            self.in_flight.discard(name)
+            self.timings[name].add(elapsed)
+            if failed:
+                self.errors += 1
+            if name in self.sources and self.values.get(name) != value:
+                self.values[name] = value
+                changed[name] = value
+        if self.in_flight:
+            self.drain_id = self.timer.after(DRAIN_MS, self._drain)
+        if changed:
+            self.on_change(changed)
+
+    def text(self, names):
+        return "\n".join(self.values[name] for name in names if self.values.get(name))
+
+    def shutdown(self):
+        for name in list(self.sources):
+            self.remove(name)
+        if self.drain_id is not None:
+            self.timer.after_cancel(self.drain_id)
+            self.drain_id = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self):
+        return {
+            "sources": {name: timing.as_dict() for name, timing in self.timings.items()},
+            "drains": self.drains,
+            "errors": self.errors,
+        }
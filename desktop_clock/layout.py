@@ -0,0 +1,97 @@
+from collections import OrderedDict
+
+RATIO_MAP = {"1/4": 4, "1/3": 3, "1/2": 2}
+ANCHOR_MAP = {"center": "center", "left": "w", "right": "e"}
+
+
+def date_font_size(time_size, ratio):
+    return time_size // RATIO_MAP.get(ratio, 3)
+
+
+def anchor_for(alignment):
+    return ANCHOR_MAP.get(alignment, "center")
+
+
+def justify_for(anchor):
+    # Multi-line text (the info lines) lines up the same way as the date.
+    return {"w": "left", "e": "right"}.get(anchor, "center")
+
+
+def label_padding(label):
+    # Extra pixels Tk adds around a label's text: (padx, pady) plus the
+    # border and highlight ring, on each side.
+    inset = label.winfo_pixels(label.cget("borderwidth")) + \
+        label.winfo_pixels(label.cget("highlightthickness"))
+    return (
+        2 * (inset + label.winfo_pixels(label.cget("padx"))),
+        2 * (inset + label.winfo_pixels(label.cget("pady")))
+    )
+
+
+def window_size(metrics, family, time_size, time_text, date_text, ratio,
+                show_date, padding=(0, 0), info_text="", time_extent=None):
+    # time_extent: the time line's (width, height) when it is not drawn as
+    # text (glyph images); the date and info lines are measured either way.
+    pad_x, pad_y = padding
+    width, height = time_extent or metrics.extent(family, time_size, "bold", time_text)
+    width, height = width + pad_x, height + pad_y
+    if show_date:
+        date_width, date_height = metrics.extent(
+            family, date_font_size(time_size, ratio), "normal", date_text
+        )
+        width = max(width, date_width + pad_x)
+        height += date_height + pad_y
+    if info_text:
+        info_width, info_height = metrics.extent(
+            family, date_font_size(time_size, ratio), "normal", info_text
+        )
+        width = max(width, info_width + pad_x)
+        height += info_height + pad_y
+    return int(width), int(height)
+
+
+class TextMetrics:
+    # Text extents from tkinter.font, cached in a bounded LRU so repeated
+    # layouts never go back to Tk.
+
+    def __init__(self, root, maxsize=256, max_fonts=16):
+        self.root = root
+        self.maxsize = maxsize
+        self.max_fonts = max_fonts
+        self.hits = 0
+        self.misses = 0
+        self._extents = OrderedDict()
+        self._fonts = OrderedDict()
+
+    def _font(self, family, size, weight):
+        key = (family, size, weight)
+        font = self._fonts.get(key)
+        if font is None:
+            from tkinter import font as tkfont
+            font = tkfont.Font(root=self.root, family=family, size=size, weight=weight)
+            self._fonts[key] = font
+            if len(self._fonts) > self.max_fonts:
+                self._fonts.popitem(last=False)
+        else:
+            self._fonts.move_to_end(key)
+        return font
+
+    def extent(self, family, size, weight, text):
+        key = (family, size, weight, text)
+        extent = self._extents.get(key)
+        if extent is not None:
+            self.hits += 1
+            self._extents.move_to_end(key)
+            return extent
+
+        self.misses += 1
+        font = self._font(family, size, weight)
+        lines = text.split("\n")
+        extent = (
+            max(font.measure(line) for line in lines),
+            font.metrics("linespace") * len(lines)
+        )
+        self._extents[key] = extent
+        if len(self._extents) > self.maxsize:
+            self._extents.popitem(last=False)
+        return extent
@@ -0,0 +1,56 @@
+import json
+import os
+import string
+from functools import lru_cache
+
+LOCALE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "locales")
+FALLBACK = "English"
+
+# Pattern fields -> how to read them from a struct_time.
+_FIELDS = {
+    "day": lambda t, months, days: t.tm_mday,
+    "month": lambda t, months, days: months[t.tm_mon - 1],
+    "year": lambda t, months, days: t.tm_year,
+    "weekday": lambda t, months, days: days[t.tm_wday],
+}
+
+
+@lru_cache(maxsize=1)
+def _index():
+    with open(os.path.join(LOCALE_DIR, "index.json"), encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def locale_names():
+    return list(_index())
+
+
+def compile_pattern(pattern, months, days):
+    # "{weekday}, {month} {day}" -> "{0}, {1} {2}" plus one getter per slot,
+    # so formatting a date is a single str.format call.
+    template, getters = [], []
+    for literal, field, spec, conversion in string.Formatter().parse(pattern):
+        template.append(literal.replace("{", "{{").replace("}", "}}"))
+        if field is None:
+            continue
+        if field not in _FIELDS:
+            raise ValueError(f"unknown date field {field!r} in {pattern!r}")
+        suffix = (f"!{conversion}" if conversion else "") + (f":{spec}" if spec else "")
+        template.append(f"{{{len(getters)}{suffix}}}")
+        getters.append(_FIELDS[field])
+    render = "".join(template).format
+    getters = tuple(getters)
+
+    def format_date(t):
+        return render(*[getter(t, months, days) for getter in getters])
+
+    return format_date
+
+
+@lru_cache(maxsize=4)
+def date_formatter(name):
+    entry = _index().get(name) or _index()[FALLBACK]
+    with open(os.path.join(LOCALE_DIR, f"{entry['file']}.json"), encoding="utf-8") as handle:
+        data = json.load(handle)
+    names = data[entry["variant"]]
+    return compile_pattern(data["pattern"], names["months"], names["days"])
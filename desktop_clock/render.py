@@ -0,0 +1,283 @@
+import tkinter as tk
+
+from desktop_clock.glyphs import GLYPH_CACHE
+from desktop_clock.layout import date_font_size, justify_for, label_padding, window_size
+
+_MISSING = object()
+
+
+class Renderer:
+    # Remembers what was last sent to Tk so unchanged updates cost nothing.
+
+    def __init__(self, root):
+        self.root = root
+        self.applied = 0
+        self.skipped = 0
+        self.lowered = 0
+        self.lower_skipped = 0
+        self.geometry_calls = 0
+        self.needs_lower = True
+        # Set during a live resize: displays may lay out a cheaper way until
+        # the size is committed.
+        self.previewing = False
+        self._state = {}
+
+    def _changed(self, key, options):
+        last = self._state.setdefault(key, {})
+        changed = {
+            name: value for name, value in options.items()
+            if last.get(name, _MISSING) != value
+        }
+        if changed:
+            last.update(changed)
+            self.applied += 1
+        else:
+            self.skipped += 1
+        return changed
+
+    def mark_raised(self, event=None):
+        # <Map> bound on the root also fires for every child widget.
+        if event is not None and event.widget is not self.root:
+            return
+        self.needs_lower = True
+
+    def lower(self):
+        if not self.needs_lower:
+            self.lower_skipped += 1
+            return
+        self.root.lower()
+        self.needs_lower = False
+        self.lowered += 1
+
+    def geometry(self, spec):
+        self.root.geometry(spec)
+        self.geometry_calls += 1
+
+    def stats(self):
+        return {
+            "applied": self.applied,
+            "skipped": self.skipped,
+            "lowered": self.lowered,
+            "lower_skipped": self.lower_skipped,
+            "geometry_calls": self.geometry_calls,
+        }
+
+
+class LabelRenderer(Renderer):
+    def config(self, widget, **options):
+        changed = self._changed(str(widget), options)
+        if changed:
+            widget.config(**changed)
+        return bool(changed)
+
+
+# -------------------- Display backends --------------------
+# All draw the time line, the optional date line and any info lines into a
+# window and expose the same methods, so a clock face does not care which
+# it has.
+
+class LabelDisplay(LabelRenderer):
+    kind = "label"
+
+    def __init__(self, root, bg):
+        super().__init__(root)
+        self.container = tk.Frame(root, bg=bg)
+        self.container.pack(expand=True, fill="both")
+        self.time_label = tk.Label(self.container, fg="white", bg=bg)
+        self.time_label.pack(side="top")
+        self.date_label = tk.Label(self.container, fg="white", bg=bg)
+        self.info_label = tk.Label(self.container, fg="white", bg=bg)
+        self.padding = label_padding(self.time_label)
+        self.widgets = (self.time_label, self.date_label, self.info_label)
+
+    def set_time_text(self, text):
+        self.config(self.time_label, text=text)
+
+    def set_date_text(self, text):
+        self.config(self.date_label, text=text)
+
+    def shown_text(self):
+        return self.time_label.cget("text"), self.date_label.cget("text")
+
+    def layout(self, metrics, family, size, ratio, time_text, date_text, anchor, show_date,
+               info_text=""):
+        small_font = (family, date_font_size(size, ratio), "normal")
+        self.config(self.time_label, font=(family, size, "bold"), text=time_text)
+        self.config(self.date_label, font=small_font, text=date_text)
+        self.config(self.info_label, font=small_font, text=info_text, justify=justify_for(anchor))
+
+        self.time_label.pack_configure(anchor=anchor)
+        if show_date:
+            self.date_label.pack(side="top", fill="x", after=self.time_label)
+            self.date_label.pack_configure(anchor=anchor)
+        else:
+            self.date_label.pack_forget()
+        if info_text:
+            above = self.date_label if show_date else self.time_label
+            self.info_label.pack(side="top", fill="x", after=above, anchor=anchor)
+        else:
+            self.info_label.pack_forget()
+
+        # Size only: Tk keeps the current position, no layout flush or winfo round-trips
+        width, height = window_size(metrics, family, size, time_text, date_text, ratio,
+                                    show_date, self.padding, info_text)
+        self.geometry(f"{width}x{height}")
+        return width, height
+
+
+class CanvasDisplay(Renderer):
+    kind = "canvas"
+    # What a default tk.Label adds around its text, so both backends size
+    # the window the same way.
+    padding = (6, 6)
+
+    def __init__(self, root, bg):
+        super().__init__(root)
+        self.canvas = tk.Canvas(root, bg=bg, highlightthickness=0, borderwidth=0)
+        self.canvas.pack(expand=True, fill="both")
+        self.time_item = self.canvas.create_text(0, 0, fill="white", anchor="n")
+        self.date_item = self.canvas.create_text(0, 0, fill="white", anchor="n", state="hidden")
+        self.info_item = self.canvas.create_text(0, 0, fill="white", anchor="n", state="hidden")
+        self.widgets = (self.canvas,)
+
+    def itemconfig(self, item, **options):
+        changed = self._changed(item, options)
+        if changed:
+            self.canvas.itemconfigure(item, **changed)
+        return bool(changed)
+
+    def coords(self, item, x, y):
+        if self._changed(f"{item}:coords", {"xy": (x, y)}):
+            self.canvas.coords(item, x, y)
+
+    def set_time_text(self, text):
+        self.itemconfig(self.time_item, text=text)
+
+    def set_date_text(self, text):
+        self.itemconfig(self.date_item, text=text)
+
+    def shown_text(self):
+        return self.canvas.itemcget(self.time_item, "text"), self.canvas.itemcget(self.date_item, "text")
+
+    def layout(self, metrics, family, size, ratio, time_text, date_text, anchor, show_date,
+               info_text=""):
+        width, height = window_size(metrics, family, size, time_text, date_text, ratio,
+                                    show_date, self.padding, info_text)
+        x, text_anchor = self._anchor_x(anchor, width)
+        time_height = metrics.extent(family, size, "bold", time_text)[1]
+
+        self.itemconfig(self.time_item, font=(family, size, "bold"), text=time_text,
+                        anchor=text_anchor)
+        self.coords(self.time_item, x, self.padding[1] // 2)
+        self._layout_date(x, text_anchor, time_height, family, size, ratio, date_text, show_date)
+        self._layout_info(metrics, x, text_anchor, time_height, family, size, ratio,
+                          date_text, show_date, info_text)
+
+        self.geometry(f"{width}x{height}")
+        return width, height
+
+    def _anchor_x(self, anchor, width):
+        pad_x = self.padding[0]
+        return {
+            "w": (pad_x // 2, "nw"),
+            "e": (width - pad_x // 2, "ne"),
+        }.get(anchor, (width // 2, "n"))
+
+    def _layout_date(self, x, text_anchor, time_height, family, size, ratio, date_text, show_date):
+        pad_y = self.padding[1]
+        # Hiding the date is an item state change, not a repack.
+        self.itemconfig(self.date_item, font=(family, date_font_size(size, ratio), "normal"),
+                        text=date_text, anchor=text_anchor,
+                        state="normal" if show_date else "hidden")
+        self.coords(self.date_item, x, time_height + pad_y + pad_y // 2)
+
+    def _layout_info(self, metrics, x, text_anchor, time_height, family, size, ratio,
+                     date_text, show_date, info_text):
+        pad_y = self.padding[1]
+        small_size = date_font_size(size, ratio)
+        top = time_height + pad_y
+        if show_date:
+            top += metrics.extent(family, small_size, "normal", date_text)[1] + pad_y
+        self.itemconfig(self.info_item, font=(family, small_size, "normal"), text=info_text,
+                        anchor=text_anchor, justify=justify_for(text_anchor[-1]),
+                        state="normal" if info_text else "hidden")
+        self.coords(self.info_item, x, top + pad_y // 2)
+
+
+class GlyphDisplay(CanvasDisplay):
+    # The time line is a row of image items, one per character, drawn
+    # from a pre-rendered glyph atlas; a minute change swaps the image of
+    # the one or two slots that changed. Without Pillow, for a font it
+    # cannot load, or while a resize is still being previewed, this behaves
+    # exactly like CanvasDisplay.
+    kind = "glyphs"
+
+    def __init__(self, root, bg, colour="white"):
+        super().__init__(root, bg)
+        self.colour = colour
+        self.atlas = None
+        self.slots = []
+        self.slot_text = ""
+
+    def set_time_text(self, text):
+        if self.atlas is None or len(text) != len(self.slots) or not self.atlas.covers(text):
+            super().set_time_text(text)
+            return
+        for item, old, new in zip(self.slots, self.slot_text, text):
+            if old != new:
+                self.itemconfig(item, image=self.atlas.images[new])
+        self.slot_text = text
+
+    def shown_text(self):
+        time_text, date_text = super().shown_text()
+        return self.slot_text or time_text, date_text
+
+    def layout(self, metrics, family, size, ratio, time_text, date_text, anchor, show_date,
+               info_text=""):
+        # No atlas per slider frame: it is built once the size is committed
+        self.atlas = None if self.previewing else GLYPH_CACHE.get(self.root, family, size, self.colour)
+        if self.atlas is None or not self.atlas.covers(time_text):
+            self._set_slot_count(0)
+            self.itemconfig(self.time_item, state="normal")
+            return super().layout(metrics, family, size, ratio, time_text, date_text,
+                                  anchor, show_date, info_text)
+
+        pad_y = self.padding[1]
+        slot_widths = [self.atlas.slot_widths[char] for char in time_text]
+        time_width = sum(slot_widths)
+        width, height = window_size(metrics, family, size, time_text, date_text, ratio, show_date,
+                                    self.padding, info_text, (time_width, self.atlas.height))
+
+        x, text_anchor = self._anchor_x(anchor, width)
+        left = {"nw": x, "ne": x - time_width}.get(text_anchor, x - time_width // 2)
+        self.itemconfig(self.time_item, state="hidden")
+        self._set_slot_count(len(time_text))
+        for item, char, slot_width in zip(self.slots, time_text, slot_widths):
+            self.coords(item, left + slot_width // 2, pad_y // 2)
+            self.itemconfig(item, image=self.atlas.images[char])
+            left += slot_width
+        self.slot_text = time_text
+
+        self._layout_date(x, text_anchor, self.atlas.height, family, size, ratio,
+                          date_text, show_date)
+        self._layout_info(metrics, x, text_anchor, self.atlas.height, family, size, ratio,
+                          date_text, show_date, info_text)
+        self.geometry(f"{width}x{height}")
+        return width, height
+
+    def _set_slot_count(self, count):
+        while len(self.slots) < count:
+            self.slots.append(self.canvas.create_image(0, 0, anchor="n"))
+        while len(self.slots) > count:
+            item = self.slots.pop()
+            self.canvas.delete(item)
+            self._state.pop(item, None)
+            self._state.pop(f"{item}:coords", None)
+        self.slot_text = ""
+
+
+DISPLAYS = {display.kind: display for display in (LabelDisplay, CanvasDisplay, GlyphDisplay)}
+
+
+def create_display(kind, root, bg):
+    return DISPLAYS.get(kind, LabelDisplay)(root, bg)
@@ -0,0 +1,70 @@
+from desktop_clock.drag import FRAME_MS
+
+MIN_SIZE = 40
+MAX_SIZE = 400
+# The slider counts as released once it has been left alone this long
+# (keyboard and wheel changes have no ButtonRelease to commit on).
+SETTLE_MS = 400
+
+
+def anchored_x(x, old_width, new_width, alignment):
+    # Keep the edge the lines are aligned to, or the centre, where it was.
+    if alignment == "left":
+        return x
+    if alignment == "right":
+        return x + old_width - new_width
+    return x + (old_width - new_width) // 2
+
+
+class LiveResize:
+    # Scale events only record the latest value; at most one preview per
+    # frame lays it out, and commit runs once for the value the user kept
+    # (even an unchanged one, so the display can leave its preview mode).
+
+    def __init__(self, widget, value, preview, commit):
+        self.widget = widget
+        self.preview = preview
+        self.commit = commit
+        self.pending = value
+        self.shown = value
+        self.committed = value
+        self.events = 0
+        self.frames = 0
+        self.frame_id = None
+        self.settle_id = None
+        self.previewed = False
+
+    def request(self, value):
+        self.events += 1
+        self.pending = value
+        if self.frame_id is None:
+            self.frame_id = self.widget.after(FRAME_MS, self._frame)
+        if self.settle_id is not None:
+            self.widget.after_cancel(self.settle_id)
+        self.settle_id = self.widget.after(SETTLE_MS, self.finish)
+
+    def _frame(self):
+        self.frame_id = None
+        if self.pending != self.shown:
+            self.shown = self.pending
+            self.preview(self.shown)
+            self.frames += 1
+            self.previewed = True
+
+    def finish(self):
+        self.cancel()
+        self._frame()
+        if self.shown != self.committed or self.previewed:
+            self.committed = self.shown
+            self.previewed = False
+            self.commit(self.shown)
+
+    def cancel(self):
+        for name in ("frame_id", "settle_id"):
+            after_id = getattr(self, name)
+            if after_id is not None:
+                self.widget.after_cancel(after_id)
+                setattr(self, name, None)
+
+    def stats(self):
+        return {"events": self.events, "frames": self.frames}
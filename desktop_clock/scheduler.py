@@ -0,0 +1,147 @@
+import time
+
+from desktop_clock.timesource import SYSTEM_CLOCK
+
+# Wall time and monotonic time may drift apart by this much between two
+# wakeups before we treat it as a clock jump (suspend/resume, NTP step).
+JUMP_TOLERANCE = 2.0
+
+# Tk timers can fire a hair early; aim just past the boundary instead.
+WAKE_SLACK_MS = 5
+
+
+def next_minute(now):
+    return now + 60 - (now % 60)
+
+
+def every(seconds):
+    # Boundaries on multiples of the period, so jobs with related periods
+    # (and the minute tick) land on the same wakeup.
+    def boundary(now):
+        return (now // seconds + 1) * seconds
+
+    return boundary
+
+
+def next_midnight(now):
+    t = time.localtime(now)
+    # mktime normalises tm_mday overflow and resolves DST for us.
+    return time.mktime((t.tm_year, t.tm_mon, t.tm_mday + 1, 0, 0, 0, 0, 0, -1))
+
+
+def next_midnight_in(tz):
+    from datetime import datetime, timedelta
+
+    def boundary(now):
+        tomorrow = (datetime.fromtimestamp(now, tz) + timedelta(days=1)).date()
+        return datetime(tomorrow.year, tomorrow.month, tomorrow.day, tzinfo=tz).timestamp()
+
+    return boundary
+
+
+class TickJob:
+    def __init__(self, callback, next_boundary):
+        self.callback = callback
+        self.next_boundary = next_boundary
+        self.target = None
+        self.runs = 0
+        self.elapsed = 0.0
+        self.max_elapsed = 0.0
+
+    def run(self, now):
+        started = time.perf_counter()
+        self.callback()
+        spent = time.perf_counter() - started
+        self.runs += 1
+        self.elapsed += spent
+        self.max_elapsed = max(self.max_elapsed, spent)
+        self.target = self.next_boundary(now)
+
+
+class TickScheduler:
+    # One Tk timer serves every job; it is always armed for the earliest
+    # boundary, so the process wakes only when something has to change.
+
+    def __init__(self, widget, time_source=SYSTEM_CLOCK):
+        self.widget = widget
+        self.time_source = time_source
+        self.timer = time_source.timers(widget)
+        self.jobs = []
+        self.after_id = None
+        self.wakeups = 0
+        self.jumps = 0
+        self.suspended = False
+        self.suspensions = 0
+        self._armed_wall = None
+        self._armed_mono = None
+
+    def add_job(self, callback, next_boundary=next_minute):
+        job = TickJob(callback, next_boundary)
+        self.jobs.append(job)
+        return job
+
+    def remove_job(self, job):
+        self.jobs.remove(job)
+        if self.after_id is not None:
+            self.cancel()
+            if self.jobs:
+                self._arm(self.time_source.time())
+
+    def start(self):
+        self.cancel()
+        now = self.time_source.time()
+        for job in self.jobs:
+            job.run(now)
+        self._arm(now)
+
+    def cancel(self):
+        if self.after_id is not None:
+            self.timer.after_cancel(self.after_id)
+            self.after_id = None
+
+    def run_now(self, job):
+        # Before start() or while suspended the job just runs; start() and
+        # resume() arm the timer once every job has a target.
+        armed = self.after_id is not None
+        self.cancel()
+        now = self.time_source.time()
+        job.run(now)
+        if armed:
+            self._arm(now)
+
+    def suspend(self):
+        # Nothing is visible: drop the timer entirely until resume().
+        if not self.suspended:
+            self.suspended = True
+            self.suspensions += 1
+            self.cancel()
+
+    def resume(self):
+        # Catch up on whatever changed while hidden, then re-arm.
+        if self.suspended:
+            self.suspended = False
+            self.start()
+
+    def _arm(self, now):
+        self._armed_wall = now
+        self._armed_mono = self.time_source.monotonic()
+        target = min(job.target for job in self.jobs)
+        delay_ms = max(int((target - now) * 1000), 0) + WAKE_SLACK_MS
+        self.after_id = self.timer.after(delay_ms, self._on_timer)
+
+    def _on_timer(self):
+        self.after_id = None
+        self.wakeups += 1
+        now = self.time_source.time()
+        expected = self._armed_wall + (self.time_source.monotonic() - self._armed_mono)
+
+        if abs(now - expected) > JUMP_TOLERANCE:
+            self.jumps += 1
+            for job in self.jobs:
+                job.run(now)
+        else:
+            for job in self.jobs:
+                if now >= job.target:
+                    job.run(now)
+
+        self._arm(now)
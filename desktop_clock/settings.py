@@ -0,0 +1,131 @@
+import json
+import os
+import platform
+
+from desktop_clock.info import SOURCES
+from desktop_clock.layout import ANCHOR_MAP, RATIO_MAP
+from desktop_clock.localization import locale_names
+
+# Rapid changes (combo scrolling, drags) collapse into one write.
+SAVE_DELAY_MS = 500
+
+# How a clock face looks before anything is saved; the font comes from
+# the platform backend.
+DEFAULT_STYLE = {
+    "size": 110,
+    "show_date": True,
+    "date_align": "center",
+    "date_ratio": "1/3",
+    "lang": "Turkish",
+    "info": [],
+}
+
+
+# What the menu, the control socket and --set may set, and what a value
+# read back from settings.json must pass before a face uses it. Any JSON
+# value may arrive here, so a check never raises, it only says no.
+SETTING_CHECKS = {
+    "font": lambda v: isinstance(v, str) and v != "",
+    "size": lambda v: type(v) is int and 1 <= v <= 1000,
+    "show_date": lambda v: type(v) is bool,
+    "date_align": lambda v: isinstance(v, str) and v in ANCHOR_MAP,
+    "date_ratio": lambda v: isinstance(v, str) and v in RATIO_MAP,
+    "lang": lambda v: isinstance(v, str) and v in locale_names(),
+    "info": lambda v: isinstance(v, list) and all(isinstance(name, str) and name in SOURCES for name in v),
+    "x": lambda v: type(v) is int,
+    "y": lambda v: type(v) is int,
+}
+
+
+def checked_style(entry, defaults):
+    # A hand-edited value that fails its check falls back to the default
+    # instead of breaking startup.
+    return {key: entry[key] if key in entry and SETTING_CHECKS[key](entry[key]) else default
+            for key, default in defaults.items()}
+
+
+def write_atomic(path, data, sync=False):
+    # Bytes go to a temp file beside path, which is then renamed over it:
+    # readers see the old file or the new one, never half of one. sync also
+    # flushes them to disk first. Raises OSError; the temp file is removed.
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as handle:
+            handle.write(data)
+            if sync:
+                handle.flush()
+                os.fsync(handle.fileno())
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def user_config_dir():
+    system = platform.system()
+    home = os.path.expanduser("~")
+    if system == "Darwin":
+        base = os.path.join(home, "Library", "Application Support")
+    elif system == "Windows":
+        base = os.environ.get("APPDATA") or os.path.join(home, "AppData", "Roaming")
+    else:
+        base = os.environ.get("XDG_CONFIG_HOME") or os.path.join(home, ".config")
+    return os.path.join(base, "desktop-clock")
+
+
+class SettingsStore:
+    def __init__(self, path=None, persist=True):
+        self.path = path or os.path.join(user_config_dir(), "settings.json")
+        # persist=False: read the file but never write it (simulations)
+        self.persist = persist
+        self.values = {}
+        self.writes = 0
+        self.after_id = None
+        self._widget = None
+
+    def load(self, defaults):
+        # Only known keys with the default's type survive, so a stale or
+        # hand-edited file can never break startup.
+        self.values = dict(defaults)
+        try:
+            with open(self.path, encoding="utf-8") as handle:
+                stored = json.load(handle)
+        except (OSError, ValueError):
+            return dict(self.values)
+        if isinstance(stored, dict):
+            for key, default in defaults.items():
+                value = stored.get(key)
+                if value is None:
+                    continue
+                if default is None or type(value) is type(default):
+                    self.values[key] = value
+        return dict(self.values)
+
+    def update(self, widget, **changes):
+        if all(self.values.get(key) == value for key, value in changes.items()):
+            return
+        self.values.update(changes)
+        self._widget = widget
+        if self.after_id is not None:
+            widget.after_cancel(self.after_id)
+        self.after_id = widget.after(SAVE_DELAY_MS, self.flush)
+
+    def flush_pending(self):
+        if self.after_id is not None:
+            self.flush()
+
+    def flush(self):
+        if self.after_id is not None and self._widget is not None:
+            self._widget.after_cancel(self.after_id)
+        self.after_id = None
+        if not self.persist:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            write_atomic(self.path, json.dumps(self.values, indent=2).encode("utf-8"), sync=True)
+            self.writes += 1
+        except OSError:
+            pass
@@ -0,0 +1,177 @@
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+from desktop_clock.localization import date_formatter
+from desktop_clock.scheduler import TickScheduler, next_midnight
+from desktop_clock.timesource import SimulatedClock
+
+DAY = 86400
+# How often the simulated Tk app gets an update() to process idle work.
+TK_UPDATE_EVERY = 3600
+
+
+class HeadlessClock:
+    # The minute tick and the midnight date job wired the way a clock face
+    # wires them, rendering into strings instead of widgets.
+
+    def __init__(self, time_source, lang="English"):
+        self.time_source = time_source
+        self.format_date = date_formatter(lang)
+        self.time_text = ""
+        self.date_text = ""
+        self.scheduler = TickScheduler(None, time_source)
+        self.tick_job = self.scheduler.add_job(self.update_clock)
+        self.scheduler.add_job(self.update_date, next_midnight)
+        self.scheduler.start()
+
+    def update_clock(self):
+        self.time_text = time.strftime("%H:%M", self.time_source.localtime())
+
+    def update_date(self):
+        self.date_text = self.format_date(self.time_source.localtime())
+
+    def shown(self):
+        return self.time_text, self.date_text
+
+    def expected(self):
+        now = self.time_source.localtime()
+        return time.strftime("%H:%M", now), self.format_date(now)
+
+
+class FaceProbe:
+    # What a ClockFace shows vs what it should show right now.
+
+    def __init__(self, face):
+        self.face = face
+        self.scheduler = face.scheduler
+        self.tick_job = face.scheduler.jobs[0]
+
+    def shown(self):
+        time_text, date_text = self.face.renderer.shown_text()
+        return time_text, date_text if self.face.show_date else None
+
+    def expected(self):
+        date_text = self.face.get_formatted_date() if self.face.show_date else None
+        return time.strftime("%H:%M", self.face.now()), date_text
+
+
+def tk_object_counts(root):
+    from tkinter import font as tkfont
+    widgets, stack = 0, [root]
+    while stack:
+        widget = stack.pop()
+        widgets += 1
+        stack.extend(widget.winfo_children())
+    return {
+        "widgets": widgets,
+        "tcl_commands": len(root.tk.splitlist(root.tk.call("info", "commands"))),
+        "after_timers": len(root.tk.splitlist(root.tk.call("after", "info"))),
+        "images": len(root.image_names()),
+        "fonts": len(tkfont.names(root)),
+    }
+
+
+def simulate(probe, time_source, days, root=None):
+    # Replay `days` of ticks as fast as they run, checking after every
+    # timer that the clock shows the right time and date, and sampling
+    # CPU time, Python allocations and Tk object counts along the way.
+    state = {"mismatches": 0, "first_mismatch": None, "max_late_ms": 0.0,
+             "ticks": probe.tick_job.runs, "last_update": time_source.time()}
+
+    def check():
+        if probe.tick_job.runs != state["ticks"]:
+            state["ticks"] = probe.tick_job.runs
+            state["max_late_ms"] = max(state["max_late_ms"], time_source.time() % 60 * 1000)
+        if probe.shown() != probe.expected():
+            state["mismatches"] += 1
+            if state["first_mismatch"] is None:
+                state["first_mismatch"] = {
+                    "at": time.strftime("%Y-%m-%d %H:%M:%S", time_source.localtime()),
+                    "shown": probe.shown(),
+                    "expected": probe.expected(),
+                }
+        if root is not None and time_source.time() - state["last_update"] >= TK_UPDATE_EVERY:
+            state["last_update"] = time_source.time()
+            root.update()
+
+    gc.collect()
+    tracemalloc.start()
+    tk_start = tk_object_counts(root) if root is not None else None
+    gc_start = len(gc.get_objects())
+    wakeups_start = probe.scheduler.wakeups
+    traced = []
+    started_cpu, started_wall = time.process_time(), time.perf_counter()
+    for _ in range(days):
+        time_source.advance(DAY, after_each=check)
+        traced.append(tracemalloc.get_traced_memory()[0])
+    cpu_s, wall_s = time.process_time() - started_cpu, time.perf_counter() - started_wall
+    tracemalloc.stop()
+    gc.collect()
+
+    # Day one warms caches (fonts, formatters, metrics); growth is measured after it
+    growth = (traced[-1] - traced[0]) / (len(traced) - 1) if len(traced) > 1 else 0.0
+    report = {
+        "days": days,
+        "ticks": probe.tick_job.runs,
+        "wakeups": probe.scheduler.wakeups - wakeups_start,
+        "clock_jumps": probe.scheduler.jumps,
+        "mismatches": state["mismatches"],
+        "first_mismatch": state["first_mismatch"],
+        "max_late_ms": round(state["max_late_ms"], 3),
+        "cpu_s": round(cpu_s, 3),
+        "wall_s": round(wall_s, 3),
+        "traced_kb_after_day_1": traced[0] // 1024,
+        "traced_kb_end": traced[-1] // 1024,
+        "growth_bytes_per_day": round(growth, 1),
+        "gc_objects_growth": len(gc.get_objects()) - gc_start,
+    }
+    if root is not None:
+        report["tk_objects"] = {"start": tk_start, "end": tk_object_counts(root)}
+    return report
+
+
+def parse_start(text):
+    # "2026-03-28" or "2026-03-28T23:50" in local time
+    layout = "%Y-%m-%dT%H:%M" if "T" in text else "%Y-%m-%d"
+    return time.mktime(time.strptime(text, layout))
+
+
+def use_timezone(name):
+    # Local time as the simulated kiosk sees it (DST rules included)
+    os.environ["TZ"] = name
+    time.tzset()
+
+
+def add_arguments(parser):
+    parser.add_argument("--days", type=int, default=30, help="simulated days to replay (default: 30)")
+    parser.add_argument("--start", help="simulated start, YYYY-MM-DD[THH:MM] local time (default: now)")
+    parser.add_argument("--tz", help="simulate in this time zone, e.g. Europe/Istanbul")
+
+
+def start_clock(args):
+    if args.tz:
+        use_timezone(args.tz)
+    return SimulatedClock(parse_start(args.start) if args.start else None)
+
+
+def main(argv=None):
+    import argparse
+    import json
+    parser = argparse.ArgumentParser(
+        prog="python -m desktop_clock.simulate",
+        description="Replay days of clock ticks headlessly and report drift and growth",
+    )
+    add_arguments(parser)
+    parser.add_argument("--lang", default="English", help="date language (default: English)")
+    args = parser.parse_args(argv)
+    time_source = start_clock(args)
+    report = simulate(HeadlessClock(time_source, args.lang), time_source, args.days)
+    print(json.dumps(report, indent=2))
+    return 1 if report["mismatches"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+import os
+import sys
+import time
+import tkinter as tk
+
+_IMPORTED_AT = time.perf_counter()
+
+ENV_REPORT = "DESKTOP_CLOCK_STATS"
+# How long a display that refuses connections gets to come up at login.
+DISPLAY_WAIT = 30.0
+
+
+def seconds_since_process_start():
+    # Linux knows when the process was exec'd; elsewhere fall back to when
+    # this module was imported, which is within a few ms of that.
+    try:
+        with open("/proc/self/stat") as handle:
+            fields = handle.read().rsplit(")", 1)[1].split()
+        started = int(fields[19]) / os.sysconf("SC_CLK_TCK")
+        return time.clock_gettime(time.CLOCK_BOOTTIME) - started
+    except (OSError, ValueError, IndexError, AttributeError):
+        return time.perf_counter() - _IMPORTED_AT
+
+
+def create_root(timeout=DISPLAY_WAIT):
+    # At login the clock can start before the display accepts clients.
+    # Retry until it does instead of sleeping a fixed amount up front; any
+    # other failure (no $DISPLAY at all, no Tk) is reported right away.
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while True:
+        try:
+            return tk.Tk()
+        except tk.TclError as error:
+            if not str(error).startswith("couldn't connect to display") or \
+                    time.monotonic() + delay > deadline:
+                raise
+            time.sleep(delay)
+            delay = min(delay * 2, 1.0)
+
+
+class FirstPaint:
+    # Time-to-first-paint: process start until the time label has been
+    # exposed and Tk has gone idle (the redraw runs as an idle handler).
+
+    def __init__(self, widget, on_painted=None):
+        self.widget = widget
+        self.on_painted = on_painted
+        self.ms = None
+        self._exposed = False
+        widget.bind("<Expose>", self._on_expose, add="+")
+
+    def _on_expose(self, _event):
+        if not self._exposed:
+            self._exposed = True
+            self.widget.after_idle(self._painted)
+
+    def _painted(self):
+        self.ms = round(seconds_since_process_start() * 1000, 1)
+        if os.environ.get(ENV_REPORT, "") not in ("", "0"):
+            print(f"desktop-clock: first paint after {self.ms} ms", file=sys.stderr)
+        if self.on_painted:
+            self.on_painted(self.ms)
+
+
+def on_first_map(window, callback):
+    state = {"done": False}
+
+    def handler(event):
+        if event.widget is window and not state["done"]:
+            state["done"] = True
+            callback()
+
+    window.bind("<Map>", handler, add="+")
@@ -0,0 +1,162 @@
+import json
+import os
+import time
+import tkinter as tk
+
+from desktop_clock.fontcache import user_cache_dir
+from desktop_clock.timing import Timing
+
+ENV_ENABLE = "DESKTOP_CLOCK_STATS"
+ENV_LOG = "DESKTOP_CLOCK_STATS_LOG"
+LOG_INTERVAL_MS = 60000
+# The log rolls over to <log>.1 at this size, so a long uptime keeps at
+# most two files (three days or so of minute lines each).
+LOG_MAX_BYTES = 4 * 1024 * 1024
+WINDOW_REFRESH_MS = 1000
+
+
+def rss_kb():
+    try:
+        with open("/proc/self/statm") as handle:
+            return int(handle.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is bytes on macOS, kilobytes elsewhere.
+        return peak // 1024 if os.uname().sysname == "Darwin" else peak
+    except (ImportError, AttributeError):
+        return None
+
+
+class ClockStats:
+    # Opt-in: until enable() runs nothing is wrapped or scheduled, and the
+    # counters read here are ones the scheduler, renderer and dragger keep
+    # anyway.
+
+    def __init__(self, root, scheduler, renderer, dragger, first_paint=None, info=None):
+        self.root = root
+        self.first_paint = first_paint
+        self.info = info
+        self.scheduler = scheduler
+        self.renderer = renderer
+        self.dragger = dragger
+        self.enabled = False
+        self.timings = {}
+        self.log_path = os.environ.get(ENV_LOG) or os.path.join(user_cache_dir(), "stats.jsonl")
+        self.log_after_id = None
+        self.window = None
+        self._since = None
+        self._base_wakeups = 0
+
+    def enable_from_env(self, *instrumented):
+        if os.environ.get(ENV_ENABLE, "") not in ("", "0"):
+            self.enable(*instrumented)
+
+    def enable(self, *instrumented):
+        # instrumented: (owner, method_name) pairs to time, e.g. refresh_ui
+        if self.enabled:
+            return
+        self.enabled = True
+        self._since = time.monotonic()
+        self._base_wakeups = self.scheduler.wakeups
+        for owner, name in instrumented:
+            self._instrument(owner, name)
+        self.log_after_id = self.root.after(LOG_INTERVAL_MS, self._write_log)
+
+    def _instrument(self, owner, name):
+        original = getattr(owner, name)
+        timing = self.timings.setdefault(name, Timing())
+
+        def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                timing.add(time.perf_counter() - started)
+
+        setattr(owner, name, timed)
+
+    def snapshot(self):
+        minutes = max(time.monotonic() - self._since, 1e-9) / 60
+        wakeups = self.scheduler.wakeups - self._base_wakeups
+        ticks = {}
+        for job in self.scheduler.jobs:
+            name = getattr(job.callback, "__name__", "job")
+            ticks[name] = {
+                "count": job.runs,
+                "avg_ms": job.elapsed / job.runs * 1000 if job.runs else 0.0,
+                "max_ms": job.max_elapsed * 1000,
+            }
+        return {
+            "time": time.time(),
+            "uptime_s": round(minutes * 60, 1),
+            "wakeups": wakeups,
+            "wakeups_per_minute": round(wakeups / minutes, 2),
+            "clock_jumps": self.scheduler.jumps,
+            "suspended": self.scheduler.suspended,
+            "suspensions": self.scheduler.suspensions,
+            "ticks": ticks,
+            "timings": {name: timing.as_dict() for name, timing in self.timings.items()},
+            "lower_calls": self.renderer.lowered,
+            "lower_skipped": self.renderer.lower_skipped,
+            "label_updates": self.renderer.applied,
+            "label_updates_skipped": self.renderer.skipped,
+            "geometry_calls": self.renderer.geometry_calls + self.dragger.geometry_calls,
+            "drag_events": self.dragger.events,
+            "first_paint_ms": self.first_paint.ms if self.first_paint else None,
+            "info_sampling": self.info.stats() if self.info else None,
+            "cpu_s": round(time.process_time(), 3),
+            "rss_kb": rss_kb(),
+        }
+
+    def _write_log(self):
+        self.log_after_id = self.root.after(LOG_INTERVAL_MS, self._write_log)
+        try:
+            os.makedirs(os.path.dirname(self.log_path) or ".", exist_ok=True)
+            with open(self.log_path, "a", encoding="utf-8") as handle:
+                handle.write(json.dumps(self.snapshot()) + "\n")
+                size = handle.tell()
+            if size >= LOG_MAX_BYTES:
+                os.replace(self.log_path, f"{self.log_path}.1")
+        except OSError:
+            pass
+
+    def show(self, *instrumented):
+        self.enable(*instrumented)
+        if self.window is None or not self.window.winfo_exists():
+            self.window = StatsWindow(self.root, self)
+        else:
+            self.window.deiconify()
+            self.window.lift()
+
+
+class StatsWindow(tk.Toplevel):
+    def __init__(self, parent, stats):
+        super().__init__(parent)
+        self.title("Clock Stats")
+        self.resizable(False, False)
+        self.stats = stats
+        self.text_label = tk.Label(self, font=("Courier", 10), justify="left", anchor="w")
+        self.text_label.pack(padx=10, pady=10)
+        self.after_id = None
+        self.bind("<Destroy>", self._on_destroy)
+        self._refresh()
+
+    def _refresh(self):
+        lines = []
+        for key, value in self.stats.snapshot().items():
+            if isinstance(value, dict):
+                lines.append(f"{key}:")
+                for name, timing in value.items():
+                    lines.append(f"  {name}: {timing}")
+            else:
+                lines.append(f"{key}: {value}")
+        self.text_label.config(text="\n".join(lines))
+        self.after_id = self.after(WINDOW_REFRESH_MS, self._refresh)
+
+    def _on_destroy(self, event):
+        if event.widget is self and self.after_id is not None:
+            self.after_cancel(self.after_id)
+            self.after_id = None
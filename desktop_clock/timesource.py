@@ -0,0 +1,83 @@
+import heapq
+import itertools
+import time
+
+
+class SystemClock:
+    # Where the scheduler and the formatters read the time from, and where
+    # the scheduler arms its timer. Everything real: wall clock and Tk.
+    simulated = False
+
+    def time(self):
+        return time.time()
+
+    def monotonic(self):
+        return time.monotonic()
+
+    def localtime(self):
+        return time.localtime(self.time())
+
+    def now_in(self, tz):
+        from datetime import datetime
+        return datetime.fromtimestamp(self.time(), tz).timetuple()
+
+    def timers(self, widget):
+        return widget
+
+
+SYSTEM_CLOCK = SystemClock()
+
+
+class SimulatedClock(SystemClock):
+    # Virtual time that only moves in advance(). It is also the timer queue
+    # the scheduler arms, so days of ticks replay in order without waiting.
+    simulated = True
+
+    def __init__(self, start=None):
+        self.now = time.time() if start is None else start
+        self.mono = 0.0
+        self.fired = 0
+        self._queue = []
+        self._cancelled = set()
+        self._ids = itertools.count(1)
+
+    def time(self):
+        return self.now
+
+    def monotonic(self):
+        return self.mono
+
+    def timers(self, widget):
+        return self
+
+    def after(self, ms, callback):
+        after_id = f"sim#{next(self._ids)}"
+        heapq.heappush(self._queue, (self.now + ms / 1000, after_id, callback))
+        return after_id
+
+    def after_cancel(self, after_id):
+        self._cancelled.add(after_id)
+
+    def advance(self, seconds, after_each=None):
+        # Fire every timer due before the end, each at its own due time.
+        end = self.now + seconds
+        while self._queue and self._queue[0][0] <= end:
+            due, after_id, callback = heapq.heappop(self._queue)
+            if after_id in self._cancelled:
+                self._cancelled.discard(after_id)
+                continue
+            self._move(due)
+            callback()
+            self.fired += 1
+            if after_each is not None:
+                after_each()
+        self._move(end)
+
+    def jump(self, seconds):
+        # Wall clock steps (NTP, manual change) while monotonic time does not.
+        self.now += seconds
+
+    def _move(self, when):
+        if when > self.now:
+            self.mono += when - self.now
+            self.now = when
@@ -0,0 +1,144 @@
+import os
+import platform
+import shutil
+import subprocess
+import tkinter as tk
+
+ENV_SUSPEND = "DESKTOP_CLOCK_SUSPEND"
+
+
+class VisibilityMonitor:
+    # Visible while the session is active and at least one clock window
+    # can be seen. Detectors push changes in; nothing here polls.
+
+    def __init__(self, on_change):
+        self.on_change = on_change
+        self.windows = {}
+        self.session = {}
+        self.visible = True
+
+    def report_window(self, window, visible):
+        self.windows[str(window)] = visible
+        self._update()
+
+    def forget_window(self, window):
+        self.windows.pop(str(window), None)
+        self._update()
+
+    def report_session(self, source, active):
+        self.session[source] = active
+        self._update()
+
+    def _update(self):
+        visible = all(self.session.values()) and (
+            not self.windows or any(self.windows.values())
+        )
+        if visible != self.visible:
+            self.visible = visible
+            self.on_change(visible)
+
+
+class WindowDetector:
+    def __init__(self, window):
+        self.window = window
+
+    def start(self, monitor):
+        def report(visible):
+            def handler(event):
+                if event.widget is self.window:
+                    monitor.report_window(self.window, visible(event))
+            return handler
+
+        self.window.bind("<Map>", report(lambda e: True), add="+")
+        self.window.bind("<Unmap>", report(lambda e: False), add="+")
+        self.window.bind(
+            "<Visibility>", report(lambda e: e.state != "VisibilityFullyObscured"), add="+"
+        )
+
+    def stop(self):
+        pass
+
+
+class ManualDetector:
+    # Stand-in session detector for tests and benchmarks.
+
+    def __init__(self, name="manual"):
+        self.name = name
+        self.monitor = None
+
+    def start(self, monitor):
+        self.monitor = monitor
+
+    def set_active(self, active):
+        self.monitor.report_session(self.name, active)
+
+    def stop(self):
+        self.monitor = None
+
+
+class ScreensaverDetector:
+    # Listens for ActiveChanged from the freedesktop/GNOME screensaver over
+    # D-Bus. dbus-monitor's output is watched with a Tk file handler, so a
+    # locked screen costs no wakeups until it unlocks.
+
+    MATCHES = [
+        "type='signal',interface='org.freedesktop.ScreenSaver',member='ActiveChanged'",
+        "type='signal',interface='org.gnome.ScreenSaver',member='ActiveChanged'",
+    ]
+
+    def __init__(self, root):
+        self.root = root
+        self.process = None
+        self.monitor = None
+        self.pending = b""
+
+    @classmethod
+    def available(cls):
+        return platform.system() == "Linux" and shutil.which("dbus-monitor") is not None
+
+    def start(self, monitor):
+        self.monitor = monitor
+        try:
+            self.process = subprocess.Popen(
+                ["dbus-monitor", "--session", *self.MATCHES],
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, bufsize=0
+            )
+        except OSError:
+            return
+        self.root.tk.createfilehandler(self.process.stdout, tk.READABLE, self._on_readable)
+        self.root.bind("<Destroy>", lambda e: e.widget is self.root and self.stop(), add="+")
+
+    def _on_readable(self, stream, _mask):
+        # Read the fd directly: a buffered readline() would leave the rest of
+        # a message (the "boolean" line) in Python's buffer, where the file
+        # handler never sees it until the next signal arrives.
+        data = os.read(stream.fileno(), 4096)
+        if not data:
+            self.stop()
+            return
+        *lines, self.pending = (self.pending + data).split(b"\n")
+        for line in lines:
+            words = line.split()
+            if words[:1] == [b"boolean"] and len(words) > 1:
+                self.monitor.report_session("screensaver", words[1] != b"true")
+
+    def stop(self):
+        if self.process is None:
+            return
+        try:
+            self.root.tk.deletefilehandler(self.process.stdout)
+        except tk.TclError:
+            pass
+        self.process.terminate()
+        self.process = None
+        self.pending = b""
+
+
+def suspension_enabled():
+    return os.environ.get(ENV_SUSPEND, "1") != "0"
+
+
+def session_detectors(root):
+    if ScreensaverDetector.available():
+        return [ScreensaverDetector(root)]
+    return []
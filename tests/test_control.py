@@ -0,0 +1,131 @@
+import json
+import os
+import socket
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from desktop_clock import control
+from desktop_clock.control import ControlServer, parse_assignments
+
+
+class FakeTk:
+    # The file-handler calls ControlServer makes, without an interpreter.
+
+    def __init__(self):
+        self.handlers = {}
+
+    def createfilehandler(self, file, mask, callback):
+        self.handlers[file] = callback
+
+    def deletefilehandler(self, file):
+        self.handlers.pop(file, None)
+
+
+class ParseAssignmentsTest(unittest.TestCase):
+    def test_json_values_and_plain_strings(self):
+        self.assertEqual(
+            parse_assignments(["size=90", "show_date=false", "font=Didot", 'info=["load"]']),
+            {"size": 90, "show_date": False, "font": "Didot", "info": ["load"]},
+        )
+
+    def test_rejects_pairs_without_a_key(self):
+        for pair in ("size", "=90"):
+            with self.assertRaises(ValueError):
+                parse_assignments([pair])
+
+
+class NoUnixSocketsTest(unittest.TestCase):
+    # Windows: no AF_UNIX, no fcntl and no os.getuid
+
+    def test_server_is_a_no_op(self):
+        with mock.patch.object(control, "fcntl", None), \
+                mock.patch.object(control.os, "getuid", side_effect=AttributeError, create=True):
+            server = ControlServer()
+            self.assertIsNone(server.path)
+            self.assertTrue(server.claim())
+            self.assertIsNone(control.send({"quit": True}))
+            server.close()
+
+
+@unittest.skipUnless(control.available(), "needs Unix sockets and fcntl")
+class ControlServerTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "clock.sock")
+        self.server = ControlServer(self.path)
+        self.messages = []
+        self.server.root = SimpleNamespace(tk=FakeTk())
+        self.server.handler = self.handle
+
+    def tearDown(self):
+        self.server.close()
+        self.tmp.cleanup()
+
+    def handle(self, message):
+        self.messages.append(message)
+        if "set" in message and not isinstance(message["set"], dict):
+            raise ValueError("'set' must be an object")
+        if message.get("crash"):
+            raise TypeError("handler bug")
+        return {"ok": True}
+
+    def exchange(self, *chunks):
+        # Feed the server one end of a socket pair, chunk by chunk, the way
+        # the Tk file handler would, and return the reply the client reads.
+        client, conn = socket.socketpair()
+        conn.setblocking(False)
+        self.server._buffers[conn] = bytearray()
+        for chunk in chunks:
+            client.sendall(chunk)
+            self.server._read(conn, None)
+        client.shutdown(socket.SHUT_WR)
+        if conn in self.server._buffers:
+            self.server._read(conn, None)
+        reply = client.recv(65536)
+        client.close()
+        return json.loads(reply)
+
+    def test_claim_is_exclusive(self):
+        self.assertTrue(self.server.claim())
+        second = ControlServer(self.path)
+        self.assertFalse(second.claim())
+        self.assertEqual(oct(os.stat(self.path).st_mode & 0o777), "0o600")
+
+    def test_message_in_one_read(self):
+        self.assertEqual(self.exchange(b'{"set": {"size": 90}}\n'), {"ok": True})
+        self.assertEqual(self.messages, [{"set": {"size": 90}}])
+        self.assertEqual(self.server.requests, 1)
+        self.assertEqual(self.server._buffers, {})
+
+    def test_message_split_across_reads(self):
+        self.assertEqual(self.exchange(b'{"set": {"si', b'ze": 90}}\n'), {"ok": True})
+        self.assertEqual(self.messages, [{"set": {"size": 90}}])
+
+    def test_message_ended_by_eof(self):
+        self.assertEqual(self.exchange(b'{"quit": true}'), {"ok": True})
+
+    def test_bad_messages_get_an_error_reply(self):
+        for data in (b"not json\n", b"[1, 2]\n", b'{"set": 3}\n'):
+            reply = self.exchange(data)
+            self.assertFalse(reply["ok"], data)
+            self.assertTrue(reply["error"])
+
+    def test_unexpected_handler_error_still_replies(self):
+        reply = self.exchange(b'{"crash": true}\n')
+        self.assertFalse(reply["ok"])
+        self.assertIn("handler bug", reply["error"])
+        self.assertEqual(self.server._buffers, {})
+
+    def test_send_treats_a_silent_server_as_not_answering(self):
+        # Bound and listening, but nothing ever accepts or replies
+        self.assertTrue(self.server.claim())
+        self.assertIsNone(control.send({"quit": True}, self.path, timeout=0.2))
+
+    def test_send_without_a_server(self):
+        self.assertIsNone(control.send({"quit": True}, self.path, timeout=0.2))
+
+
+if __name__ == "__main__":
+    unittest.main()
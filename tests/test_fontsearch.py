@@ -0,0 +1,32 @@
+import unittest
+
+from desktop_clock.fontsearch import FontIndex
+
+FAMILIES = ["Arial", "Arial Black", "DejaVu Sans", "DejaVu Serif", "Didot", "Liberation Serif", "Noto Sans"]
+
+
+def naive(query):
+    return [name for name in FAMILIES if query.lower() in name.lower()]
+
+
+class FontIndexTest(unittest.TestCase):
+    def test_matches_a_plain_substring_search(self):
+        index = FontIndex(FAMILIES)
+        for query in ("", "a", "ar", "SERIF", "sans", "zz", "dejavu s"):
+            self.assertEqual(index.search(query), naive(query), query)
+
+    def test_typing_narrows_the_previous_matches(self):
+        index = FontIndex(FAMILIES)
+        results = [index.search(query) for query in ("s", "se", "ser", "seri", "serif")]
+        self.assertEqual(results, [naive(query) for query in ("s", "se", "ser", "seri", "serif")])
+        self.assertEqual(index._last_rows, [3, 5])
+
+    def test_deleting_characters_widens_again(self):
+        index = FontIndex(FAMILIES)
+        index.search("serif")
+        self.assertEqual(index.search("s"), naive("s"))
+        self.assertEqual(index.search(""), FAMILIES)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import time
+import unittest
+
+from desktop_clock.info import DRAIN_MS, FakeSource, InfoSampler
+from desktop_clock.scheduler import TickScheduler
+from desktop_clock.timesource import SimulatedClock
+
+START = 1792195230.0  # 2026-10-17 00:00:30 UTC
+
+
+class InfoSamplerTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = SimulatedClock(START)
+        self.scheduler = TickScheduler(None, self.clock)
+        # The clock's own minute tick, which is always there
+        self.scheduler.add_job(lambda: None)
+        self.changes = []
+        self.sampler = InfoSampler(self.scheduler, self.changes.append)
+        self.scheduler.start()
+
+    def tearDown(self):
+        self.sampler.shutdown()
+
+    def wait_for_workers(self):
+        deadline = time.monotonic() + 5
+        while self.sampler.results.qsize() < len(self.sampler.in_flight):
+            self.assertLess(time.monotonic(), deadline, "sample never finished")
+            time.sleep(0.001)
+
+    def drain(self):
+        self.wait_for_workers()
+        self.clock.advance(DRAIN_MS / 1000)
+
+    def test_only_changed_values_reach_on_change(self):
+        source = FakeSource("fake", ["a", "a", "b"], interval=60)
+        self.sampler.add(source)
+        self.drain()
+        for _ in range(2):
+            self.clock.advance(60)
+            self.drain()
+        self.assertEqual(source.calls, 3)
+        self.assertEqual(self.changes, [{"fake": "a"}, {"fake": "b"}])
+        self.assertEqual(self.sampler.text(["fake"]), "b")
+
+    def test_no_drain_timer_when_nothing_is_in_flight(self):
+        self.sampler.add(FakeSource("fake", ["a"], interval=60))
+        self.drain()
+        self.assertIsNone(self.sampler.drain_id)
+        self.assertEqual(self.sampler.drains, 1)
+
+    def test_failing_source_counts_an_error(self):
+        source = FakeSource("fake", [])  # sample() raises ZeroDivisionError
+        self.sampler.add(source)
+        self.drain()
+        self.assertEqual(self.sampler.errors, 1)
+        self.assertEqual(self.changes, [])
+        self.assertEqual(self.sampler.in_flight, set())
+
+    def test_removed_source_is_not_reported(self):
+        self.sampler.add(FakeSource("fake", ["a"], interval=60))
+        self.sampler.remove("fake")
+        self.drain()
+        self.assertEqual(self.changes, [])
+        self.assertEqual(self.sampler.text(["fake"]), "")
+
+    def test_text_keeps_the_requested_order(self):
+        self.sampler.add(FakeSource("one", ["1"], interval=60))
+        self.sampler.add(FakeSource("two", ["2"], interval=60))
+        self.drain()
+        self.assertEqual(self.sampler.text(["two", "one"]), "2\n1")
+
+
+if __name__ == "__main__":
+    unittest.main()
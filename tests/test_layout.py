@@ -0,0 +1,110 @@
+import unittest
+
+from desktop_clock.layout import (TextMetrics, anchor_for, date_font_size, justify_for,
+                                  window_size)
+
+
+class FixedMetrics:
+    # Every character is 0.6 em wide, every line 4/3 em tall.
+
+    def __init__(self):
+        self.calls = []
+
+    def extent(self, family, size, weight, text):
+        self.calls.append((size, weight, text))
+        lines = text.split("\n")
+        return max(len(line) for line in lines) * size * 6 // 10, size * 4 // 3 * len(lines)
+
+
+class FakeFont:
+    def __init__(self, size):
+        self.size = size
+
+    def measure(self, text):
+        return len(text) * self.size
+
+    def metrics(self, option):
+        return self.size * 2
+
+
+class FakeTextMetrics(TextMetrics):
+    def __init__(self, **options):
+        super().__init__(None, **options)
+        self.fonts_built = 0
+
+    def _font(self, family, size, weight):
+        self.fonts_built += 1
+        return FakeFont(size)
+
+
+class WindowSizeTest(unittest.TestCase):
+    def test_time_only(self):
+        metrics = FixedMetrics()
+        self.assertEqual(window_size(metrics, "Didot", 100, "12:00", "Saturday", "1/3", False),
+                         (300, 133))
+        self.assertEqual(len(metrics.calls), 1)
+
+    def test_date_adds_a_line_and_may_widen(self):
+        size = window_size(FixedMetrics(), "Didot", 30, "12:00", "Saturday, October 17", "1/3", True)
+        # Time 90x40; date at 10 pt is 120x13
+        self.assertEqual(size, (120, 53))
+
+    def test_info_lines_below_the_date(self):
+        size = window_size(FixedMetrics(), "Didot", 60, "12:00", "Sat", "1/2", True,
+                           info_text="Load 0.50\nUp 3h")
+        # Time 180x80, date 54x40, info two lines of 30 pt: 162x80
+        self.assertEqual(size, (180, 200))
+
+    def test_info_without_date(self):
+        size = window_size(FixedMetrics(), "Didot", 60, "12:00", "Sat", "1/4", False,
+                           info_text="Load 0.50")
+        self.assertEqual(size, (180, 80 + 20))
+
+    def test_padding_on_every_line(self):
+        plain = window_size(FixedMetrics(), "Didot", 60, "12:00", "Sat", "1/3", True, info_text="x")
+        padded = window_size(FixedMetrics(), "Didot", 60, "12:00", "Sat", "1/3", True, (6, 4), "x")
+        self.assertEqual((padded[0] - plain[0], padded[1] - plain[1]), (6, 12))
+
+    def test_time_extent_replaces_measuring_the_time(self):
+        metrics = FixedMetrics()
+        size = window_size(metrics, "Didot", 60, "12:00", "Sat", "1/3", True, (6, 6),
+                           time_extent=(500, 90))
+        self.assertEqual(size, (506, 90 + 6 + 26 + 6))
+        self.assertEqual([call[1] for call in metrics.calls], ["normal"])
+
+
+class HelpersTest(unittest.TestCase):
+    def test_date_font_size(self):
+        self.assertEqual([date_font_size(110, ratio) for ratio in ("1/4", "1/3", "1/2", "bogus")],
+                         [27, 36, 55, 36])
+
+    def test_anchors(self):
+        self.assertEqual([anchor_for(align) for align in ("left", "center", "right", "up")],
+                         ["w", "center", "e", "center"])
+        self.assertEqual([justify_for(anchor) for anchor in ("w", "center", "e")],
+                         ["left", "center", "right"])
+
+
+class TextMetricsTest(unittest.TestCase):
+    def test_extent_and_cache_hits(self):
+        metrics = FakeTextMetrics()
+        self.assertEqual(metrics.extent("Didot", 10, "bold", "12:00"), (50, 20))
+        self.assertEqual(metrics.extent("Didot", 10, "bold", "12:00"), (50, 20))
+        self.assertEqual((metrics.hits, metrics.misses, metrics.fonts_built), (1, 1, 1))
+
+    def test_multi_line_text(self):
+        self.assertEqual(FakeTextMetrics().extent("Didot", 10, "normal", "ab\nabcd\nc"), (40, 60))
+
+    def test_least_recently_used_extent_is_evicted(self):
+        metrics = FakeTextMetrics(maxsize=2)
+        metrics.extent("Didot", 10, "bold", "a")
+        metrics.extent("Didot", 10, "bold", "b")
+        metrics.extent("Didot", 10, "bold", "a")  # "b" is now the oldest
+        metrics.extent("Didot", 10, "bold", "c")
+        self.assertEqual(list(metrics._extents), [("Didot", 10, "bold", "a"), ("Didot", 10, "bold", "c")])
+        metrics.extent("Didot", 10, "bold", "b")
+        self.assertEqual(metrics.misses, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import time
+import unittest
+
+from desktop_clock.localization import FALLBACK, compile_pattern, date_formatter, locale_names
+
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+DAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+# Saturday 17 October 2026
+SATURDAY = time.struct_time((2026, 10, 17, 12, 0, 0, 5, 290, 0))
+
+
+class CompilePatternTest(unittest.TestCase):
+    def test_fields(self):
+        format_date = compile_pattern("{weekday}, {month} {day}, {year}", MONTHS, DAYS)
+        self.assertEqual(format_date(SATURDAY), "Sat, Oct 17, 2026")
+
+    def test_format_spec_and_literal_braces(self):
+        format_date = compile_pattern("{{{day:03d}}} {month!r}", MONTHS, DAYS)
+        self.assertEqual(format_date(SATURDAY), "{017} 'Oct'")
+
+    def test_unknown_field(self):
+        with self.assertRaises(ValueError):
+            compile_pattern("{hour}", MONTHS, DAYS)
+
+
+class DateFormatterTest(unittest.TestCase):
+    def test_shipped_locales(self):
+        self.assertIn(FALLBACK, locale_names())
+        self.assertEqual(date_formatter("English")(SATURDAY), "Saturday, October 17, 2026")
+        for name in locale_names():
+            self.assertTrue(date_formatter(name)(SATURDAY))
+
+    def test_unknown_locale_falls_back(self):
+        self.assertEqual(date_formatter("Klingon")(SATURDAY), date_formatter(FALLBACK)(SATURDAY))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+
+from desktop_clock.scheduler import TickScheduler, every, next_minute
+from desktop_clock.timesource import SimulatedClock
+
+START = 1792195230.0  # 2026-10-17 00:00:30 UTC, mid-minute
+
+
+class TickSchedulerTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = SimulatedClock(START)
+        self.scheduler = TickScheduler(None, self.clock)
+        self.ticks = []
+        self.tick_job = self.scheduler.add_job(lambda: self.ticks.append(self.clock.time()))
+
+    def test_start_runs_every_job_and_arms_for_the_earliest_boundary(self):
+        slow = []
+        self.scheduler.add_job(lambda: slow.append(1), every(300))
+        self.scheduler.start()
+        self.assertEqual((len(self.ticks), len(slow)), (1, 1))
+        self.assertIsNotNone(self.scheduler.after_id)
+        self.assertEqual(self.tick_job.target, next_minute(START))
+
+    def test_one_wakeup_per_minute(self):
+        self.scheduler.start()
+        self.clock.advance(3600)
+        self.assertEqual(self.scheduler.wakeups, 60)
+        self.assertEqual(len(self.ticks), 61)
+        # Each tick lands just past its minute boundary
+        self.assertTrue(all(0 < when % 60 < 1 for when in self.ticks[1:]))
+
+    def test_suspend_drops_the_timer_and_resume_catches_up(self):
+        self.scheduler.start()
+        self.scheduler.suspend()
+        self.assertIsNone(self.scheduler.after_id)
+        self.clock.advance(600)
+        self.assertEqual(self.scheduler.wakeups, 0)
+        self.scheduler.resume()
+        self.assertEqual(len(self.ticks), 2)
+        self.assertIsNotNone(self.scheduler.after_id)
+
+    def test_run_now_before_start_does_not_arm(self):
+        # --set lang=... applies before start(): the minute job has no target yet
+        date_job = self.scheduler.add_job(lambda: None, every(86400))
+        self.scheduler.run_now(date_job)
+        self.assertIsNone(self.scheduler.after_id)
+        self.scheduler.start()
+        self.assertIsNotNone(self.scheduler.after_id)
+
+    def test_run_now_while_suspended_does_not_arm(self):
+        self.scheduler.start()
+        self.scheduler.suspend()
+        self.scheduler.run_now(self.tick_job)
+        self.assertIsNone(self.scheduler.after_id)
+
+    def test_run_now_rearms_a_started_scheduler(self):
+        self.scheduler.start()
+        self.scheduler.run_now(self.tick_job)
+        self.clock.advance(60)
+        self.assertEqual(self.scheduler.wakeups, 1)
+
+    def test_removing_a_job_rearms_for_the_rest(self):
+        slow = self.scheduler.add_job(lambda: None, every(3600))
+        self.scheduler.start()
+        self.scheduler.remove_job(self.tick_job)
+        self.assertEqual(self.scheduler.jobs, [slow])
+        self.clock.advance(600)
+        self.assertEqual(self.scheduler.wakeups, 0)
+
+    def test_wall_clock_jump_reruns_every_job(self):
+        hourly = []
+        self.scheduler.add_job(lambda: hourly.append(1), every(3600))
+        self.scheduler.start()
+        self.clock.jump(7200)
+        self.clock.advance(60)
+        self.assertEqual(self.scheduler.jumps, 1)
+        self.assertEqual(len(hourly), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
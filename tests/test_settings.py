@@ -0,0 +1,141 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from desktop_clock.settings import (DEFAULT_STYLE, SAVE_DELAY_MS, SettingsStore, checked_style,
+                                    write_atomic)
+
+DEFAULTS = dict(DEFAULT_STYLE, font="Didot", x=None, y=None, faces=[])
+
+
+class FakeWidget:
+    # after()/after_cancel() with timers fired by hand.
+
+    def __init__(self):
+        self.timers = {}
+        self.ids = 0
+
+    def after(self, ms, callback):
+        self.ids += 1
+        self.timers[self.ids] = (ms, callback)
+        return self.ids
+
+    def after_cancel(self, after_id):
+        self.timers.pop(after_id, None)
+
+    def fire(self):
+        for after_id in list(self.timers):
+            self.timers.pop(after_id)[1]()
+
+
+class SettingsStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "config", "settings.json")
+        self.widget = FakeWidget()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, data):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as handle:
+            handle.write(data if isinstance(data, str) else json.dumps(data))
+
+    def saved(self):
+        with open(self.path, encoding="utf-8") as handle:
+            return json.load(handle)
+
+    def test_missing_or_broken_file_gives_the_defaults(self):
+        self.assertEqual(SettingsStore(self.path).load(DEFAULTS), DEFAULTS)
+        self.write("{not json")
+        self.assertEqual(SettingsStore(self.path).load(DEFAULTS), DEFAULTS)
+        self.write([1, 2])
+        self.assertEqual(SettingsStore(self.path).load(DEFAULTS), DEFAULTS)
+
+    def test_load_keeps_known_keys_of_the_right_type(self):
+        self.write({"size": 90, "show_date": "yes", "font": 3, "x": 40, "unknown": 1})
+        values = SettingsStore(self.path).load(DEFAULTS)
+        self.assertEqual((values["size"], values["show_date"], values["font"], values["x"]),
+                         (90, True, "Didot", 40))
+        self.assertNotIn("unknown", values)
+
+    def test_changes_are_debounced_into_one_write(self):
+        store = SettingsStore(self.path)
+        store.load(DEFAULTS)
+        for size in (100, 101, 102):
+            store.update(self.widget, size=size)
+        self.assertEqual(len(self.widget.timers), 1)
+        self.assertEqual(next(iter(self.widget.timers.values()))[0], SAVE_DELAY_MS)
+        self.assertFalse(os.path.exists(self.path))
+        self.widget.fire()
+        self.assertEqual((store.writes, self.saved()["size"]), (1, 102))
+
+    def test_unchanged_values_schedule_nothing(self):
+        store = SettingsStore(self.path)
+        store.load(DEFAULTS)
+        store.update(self.widget, size=DEFAULTS["size"])
+        self.assertEqual(self.widget.timers, {})
+
+    def test_flush_pending_writes_now_and_cancels_the_timer(self):
+        store = SettingsStore(self.path)
+        store.load(DEFAULTS)
+        store.update(self.widget, size=70)
+        store.flush_pending()
+        self.assertEqual((self.widget.timers, self.saved()["size"]), ({}, 70))
+        store.flush_pending()
+        self.assertEqual(store.writes, 1)
+
+    def test_read_only_store_never_writes(self):
+        store = SettingsStore(self.path, persist=False)
+        store.load(DEFAULTS)
+        store.update(self.widget, size=70)
+        self.widget.fire()
+        self.assertEqual(store.writes, 0)
+        self.assertFalse(os.path.exists(self.path))
+
+
+class WriteAtomicTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "file")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_replaces_the_file(self):
+        write_atomic(self.path, b"old")
+        write_atomic(self.path, b"new", sync=True)
+        with open(self.path, "rb") as handle:
+            self.assertEqual(handle.read(), b"new")
+        self.assertEqual(os.listdir(self.tmp.name), ["file"])
+
+    def test_failed_replace_keeps_the_old_file_and_no_temp(self):
+        write_atomic(self.path, b"old")
+        with mock.patch("os.replace", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                write_atomic(self.path, b"new")
+        with open(self.path, "rb") as handle:
+            self.assertEqual(handle.read(), b"old")
+        self.assertEqual(os.listdir(self.tmp.name), ["file"])
+
+
+class CheckedStyleTest(unittest.TestCase):
+    def test_invalid_values_fall_back_to_the_defaults(self):
+        defaults = dict(DEFAULT_STYLE, font="Didot")
+        entry = {"zone": "Europe/London", "size": "big", "date_align": [1], "date_ratio": {},
+                 "lang": "Klingon", "info": [["load"]], "show_date": False, "font": "Arial"}
+        self.assertEqual(checked_style(entry, defaults),
+                         dict(defaults, show_date=False, font="Arial"))
+
+    def test_valid_values_are_kept(self):
+        defaults = dict(DEFAULT_STYLE, font="Didot")
+        entry = {"size": 60, "date_align": "right", "date_ratio": "1/2", "lang": "English",
+                 "info": ["load", "uptime"]}
+        self.assertEqual(checked_style(entry, defaults), dict(defaults, **entry))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import os
+import unittest
+
+from desktop_clock.scheduler import TickScheduler
+from desktop_clock.timesource import SimulatedClock
+from desktop_clock.visibility import ManualDetector, ScreensaverDetector, VisibilityMonitor
+
+START = 1792195230.0  # 2026-10-17 00:00:30 UTC
+
+
+class VisibilityMonitorTest(unittest.TestCase):
+    def setUp(self):
+        # Wired the way DesktopClock wires it
+        self.clock = SimulatedClock(START)
+        self.scheduler = TickScheduler(None, self.clock)
+        self.ticks = []
+        self.scheduler.add_job(lambda: self.ticks.append(self.clock.time()))
+        self.changes = []
+        self.monitor = VisibilityMonitor(self.on_change)
+        self.session = ManualDetector()
+        self.session.start(self.monitor)
+        self.scheduler.start()
+
+    def on_change(self, visible):
+        self.changes.append(visible)
+        if visible:
+            self.scheduler.resume()
+        else:
+            self.scheduler.suspend()
+
+    def test_locked_session_suspends_and_unlock_resumes(self):
+        self.session.set_active(False)
+        self.assertTrue(self.scheduler.suspended)
+        self.clock.advance(3600)
+        self.assertEqual(self.scheduler.wakeups, 0)
+        self.session.set_active(True)
+        self.assertFalse(self.scheduler.suspended)
+        self.assertEqual(len(self.ticks), 2)
+        self.assertEqual(self.changes, [False, True])
+
+    def test_hidden_only_when_every_window_is_hidden(self):
+        self.monitor.report_window(".", True)
+        self.monitor.report_window(".zone1", False)
+        self.assertFalse(self.scheduler.suspended)
+        self.monitor.report_window(".", False)
+        self.assertTrue(self.scheduler.suspended)
+        self.monitor.forget_window(".zone1")
+        self.monitor.report_window(".", True)
+        self.assertFalse(self.scheduler.suspended)
+
+    def test_every_session_source_must_be_active(self):
+        other = ManualDetector("other")
+        other.start(self.monitor)
+        other.set_active(False)
+        self.session.set_active(True)
+        self.assertTrue(self.scheduler.suspended)
+        other.set_active(True)
+        self.assertFalse(self.scheduler.suspended)
+
+    def test_repeated_reports_do_not_notify(self):
+        for _ in range(3):
+            self.session.set_active(False)
+            self.monitor.report_window(".", False)
+        self.assertEqual(self.changes, [False])
+        self.assertEqual(self.scheduler.suspensions, 1)
+
+
+class ScreensaverDetectorTest(unittest.TestCase):
+    # dbus-monitor output fed through a pipe, one file-handler call per write
+
+    def setUp(self):
+        self.detector = ScreensaverDetector(None)
+        self.monitor = VisibilityMonitor(lambda visible: None)
+        self.detector.monitor = self.monitor
+        read_fd, self.write_fd = os.pipe()
+        self.stream = os.fdopen(read_fd, "rb", buffering=0)
+
+    def tearDown(self):
+        self.stream.close()
+        os.close(self.write_fd)
+
+    def feed(self, data):
+        os.write(self.write_fd, data)
+        self.detector._on_readable(self.stream, None)
+
+    def test_header_and_value_in_one_read(self):
+        self.feed(b"signal time=1 sender=:1.2 -> member=ActiveChanged\n   boolean true\n")
+        self.assertFalse(self.monitor.visible)
+        self.feed(b"signal time=2 sender=:1.2 -> member=ActiveChanged\n   boolean false\n")
+        self.assertTrue(self.monitor.visible)
+
+    def test_line_split_across_reads(self):
+        self.feed(b"signal time=1 -> member=ActiveChanged\n   bool")
+        self.assertTrue(self.monitor.visible)
+        self.feed(b"ean true\n")
+        self.assertFalse(self.monitor.visible)
+
+
+if __name__ == "__main__":
+    unittest.main()